@@ -5,7 +5,13 @@ import math
 import os
 import json
 import traceback
+import atexit
+import gc
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
 from datetime import datetime
+from time import perf_counter
 from typing import Tuple
 
 # Initialize pygame
@@ -13,15 +19,14 @@ pygame.init()
 
 # Ensure proper font display
 pygame.font.init()
-font_path = pygame.font.match_font('simsun') or pygame.font.match_font('microsoftyahei')
-if not font_path:
-    # If Chinese font not found, use default font
-    default_font = pygame.font.get_default_font()
-    font_path = pygame.font.match_font(default_font)
 
 # Game constants
 WIDTH, HEIGHT = 800, 600
 FPS = 60
+MAX_RENDER_SKIPS = 3      # Consecutive gameplay frames that may skip drawing when the loop runs late
+RENDER_RESYNC_LAG = 0.25  # Seconds behind schedule after which pacing resyncs instead of catching up (pauses, stalls)
+DIRTY_UPDATE_MAX_AREA = WIDTH * HEIGHT // 4  # Above this many dirty pixels a gameplay frame is flipped whole
+STATIC_SCREEN_FPS = 30    # Event polling rate while a frozen start/game-over/paused screen is shown (nothing redraws)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 RED = (255, 0, 0)
@@ -32,25 +37,34 @@ YELLOW = (255, 255, 0)
 # --- Adjustable Parameters (Constants) ---
 # Hide-and-seek trigger settings
 HIDE_NEAR_DISTANCE = 180            # Mouse distance below this triggers cat hiding behavior
+HIDE_NEAR_DISTANCE_SQ = HIDE_NEAR_DISTANCE * HIDE_NEAR_DISTANCE
 HIDE_TRIGGER_RANDOM_CHANCE = 0.002  # Random chance per frame to trigger hiding (smaller = less hiding)
 HIDE_DURATION_MIN_FRAMES = int(1.0 * FPS)   # Minimum hiding duration ~1s
 HIDE_DURATION_MAX_FRAMES = int(2.0 * FPS)   # Maximum hiding duration ~2s
 HIDE_COOLDOWN_FRAMES = int(3 * FPS)       # Cooldown after hiding to avoid excessive frequency
 HIDE_INSET_MIN = 6                  # Minimum pixel inset from obstacle edge when hiding
 HIDE_INSET_FRACTION = 0.25          # Inset amount as fraction of obstacle dimensions
+HIDE_NEAREST_CELL_SHIFT = 5         # Nearest-obstacle lookups are memoized per 2**5 = 32px cat cell
+FORCED_HIDE_WAIT_FRAMES = int(1.2 * FPS)    # Forced hide: minimum lingering after reaching the target
+FORCED_HIDE_COOLDOWN_FRAMES = int(5 * FPS)  # Forced hide: cooldown before the next forced trigger
 
 # Speech bubble settings
-BUBBLE_SMOOTH_ALPHA = 0.28          # Exponential smoothing coefficient for bubble position (0-1, smaller = more stable)
+NEED_TEXTS = {"food": "I want food!", "toy": "I want a toy!"}  # Bubble text per need (Cat.get_current_need)
+BUBBLE_SMOOTH_ALPHA = (7, 25)       # Exponential smoothing coefficient for bubble position as num/den (0.28; smaller = more stable)
 BUBBLE_TAIL_LEN = 14
 BUBBLE_TAIL_W = 12
 BUBBLE_REFRESH_MIN_FRAMES = 3 * FPS
 BUBBLE_REFRESH_MAX_FRAMES = 5 * FPS
 BUBBLE_STICKY_BIAS_PX = 60          # Sticky bias: current direction enjoys reduced distance weighting to avoid frequent switching
 BUBBLE_MOUSE_BIAS_DISTANCE = 200     # Only enable "near player" bias when mouse distance to cat is below this
+BUBBLE_MOUSE_BIAS_DISTANCE_SQ = BUBBLE_MOUSE_BIAS_DISTANCE * BUBBLE_MOUSE_BIAS_DISTANCE
+BUBBLE_RELAYOUT_DISTANCE = 8         # Re-pick the bubble side only after cat or mouse moved this far (px)
+BUBBLE_RELAYOUT_DISTANCE_SQ = BUBBLE_RELAYOUT_DISTANCE * BUBBLE_RELAYOUT_DISTANCE
 
 # --- Game Flow Settings ---
 GAME_DURATION_FRAMES = 60 * FPS      # Total duration: 60 seconds
 LOSS_GRACE_FRAMES = 30 * FPS         # No affinity=0 failure check for first 30 seconds
+MESSAGE_HOLD_FRAMES = int(0.5 * FPS)  # Feedback message ("Blocked by obstacle!", hit results) stays up this long
 
 # Idle (unobstructed area) settings
 IDLE_INTERVAL_FRAMES = 10 * FPS
@@ -62,6 +76,7 @@ CAT_OPEN_SPEED_FACTOR = 0.6  # Cat movement speed in open areas (relative to Cat
 CAT_SPEED_STAGE_1 = 5        # Initial stage speed
 CAT_SPEED_STAGE_2 = 7        # Stage 2 speed (when affinity≥30)
 CAT_SPEED_STAGE_3 = 9        # Stage 3 speed (when affinity≥60)
+CAT_NEED_DRIFT_CHANCE = 0.02  # Per-move chance of a random need drift (split evenly: hunger up / playfulness up)
 
 # Cat sprite scaling filter: recommend 'nearest'，for realistic style 'smooth'
 CAT_IMAGE_FILTER = 'smooth'
@@ -91,6 +106,7 @@ ITEM_IMAGE_SCALE = {"food": 2.0, "toy": 1.0}
 SEASON_AUTO_CYCLE = False                # Disable auto cycling
 SEASON_HOLD_FRAMES = 8 * FPS             # Duration to hold each season
 SEASON_TRANSITION_FRAMES = 1             # Transition duration (1 frame = instant switch)
+SEASON_BLEND_STEPS = 16                  # Cross-fade quantization steps (blended surfaces are cached per step)
 
 # Scene switching system (Plan A: multi-scene auto switching)
 SCENE_SWITCH_INTERVAL = 20 * FPS         # Scene switch interval (20 seconds)
@@ -102,29 +118,95 @@ FONT_BODY_FILE = "MyFont.ttf"     # Body font filename (empty string means not s
 FONT_TITLE_FILE = "MyFont.ttf"   # Title font filename (empty string means not specified)
 FONT_BODY_SIZE = 12                 # Body font size
 FONT_TITLE_SIZE = 24                # Title font size
+TEXT_CACHE_MAX_ENTRIES = 64         # Rendered UI text surfaces kept for reuse (LRU)
 
 # Create log function (print to console and write to file for debugging)
 LOG_FILE = os.path.join(os.path.dirname(__file__), "game_debug.log")
+LOG_FLUSH_INTERVAL = 2.0  # Seconds between log file flushes (lines are buffered in memory meanwhile)
+LOG_ENABLED = True        # Master switch for log() (console + file); False makes log() return immediately
+LOG_HEARTBEAT = True      # Log a once-per-second heartbeat from the game loop (False skips formatting it)
+
+_LOG_QUEUE = deque()
+_log_lock = threading.Lock()
+_log_timer = None
+_log_fh = None  # Append handle, opened on the first flush and kept for the life of the process
+_log_closed = False  # Set by _close_log; later flushes drop their lines instead of reopening the file
+# Serializes file access (open/write/flush/close). Taken before _log_lock, never inside it, so batches
+# are dequeued and written in the same order and log() callers never wait on file I/O
+_log_write_lock = threading.Lock()
+
+def _write_pending():
+    """Append queued lines to the log file; caller holds _log_write_lock."""
+    global _log_timer, _log_fh
+    with _log_lock:
+        _log_timer = None
+        lines = list(_LOG_QUEUE)
+        _LOG_QUEUE.clear()
+    if not lines or _log_closed:
+        return
+    try:
+        if _log_fh is None:
+            _log_fh = open(LOG_FILE, "a", encoding="utf-8")
+        _log_fh.write("".join(lines))
+        _log_fh.flush()
+    except Exception:
+        pass
 
-def log(msg: str):
+def _flush_log():
+    """Write all pending log lines with a single append to the persistent handle (best-effort; ignore failures)."""
+    with _log_write_lock:
+        _write_pending()
+
+def _close_log():
+    """Flush buffered lines and close the log file handle; a pending timed flush is cancelled."""
+    global _log_timer, _log_fh, _log_closed
+    with _log_write_lock:
+        with _log_lock:
+            if _log_timer is not None:
+                _log_timer.cancel()
+        _write_pending()
+        _log_closed = True
+        if _log_fh is not None:
+            try:
+                _log_fh.close()
+            except Exception:
+                pass
+            _log_fh = None
+
+# Make sure buffered lines reach the file on normal exit and sys.exit()
+atexit.register(_close_log)
+
+def log(msg: str, *args):
+    """Log a line; with args, msg is a %-format string applied only when logging is enabled."""
+    global _log_timer
+    if not LOG_ENABLED:
+        return
+    if args:
+        msg = msg % args
     ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{ts}] {msg}"
     try:
         print(line)
     except Exception:
         pass
-    # Also append to a log file (best-effort; ignore failures)
-    try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
-    except Exception:
-        pass
+    # Also append to a log file: queue the line and schedule one flush per interval
+    with _log_lock:
+        if _log_closed:
+            return
+        _LOG_QUEUE.append(line + "\n")
+        if _log_timer is None:
+            _log_timer = threading.Timer(LOG_FLUSH_INTERVAL, _flush_log)
+            _log_timer.daemon = True
+            _log_timer.start()
 
 # Assets helpers
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 
-def load_image(filename: str):
-    """Load PNG from ./assets; return None if missing or failed."""
+def load_image(filename: str, alpha: bool = True):
+    """Load PNG from ./assets; return None if missing or failed.
+    Opaque images (no colorkey, every pixel alpha 255) come back convert()ed rather than convert_alpha()ed,
+    so blits skip per-pixel blending. alpha=False always returns an opaque surface: colorkeyed and
+    translucent pixels are flattened onto WHITE, the colour the scene is cleared to beneath backgrounds."""
     path = os.path.join(ASSETS_DIR, filename)
     if not os.path.exists(path):
         try:
@@ -133,11 +215,35 @@ def load_image(filename: str):
             pass
         return None
     try:
-        return pygame.image.load(path).convert_alpha()
+        img = pygame.image.load(path)
+        if not alpha:
+            flat = pygame.Surface(img.get_size()).convert()
+            flat.fill(WHITE)
+            flat.blit(img, (0, 0))
+            return flat
+        if img.get_colorkey() is None:
+            w, h = img.get_size()
+            if img.get_masks()[3] == 0 or pygame.mask.from_surface(img, 254).count() == w * h:
+                return img.convert()
+        return img.convert_alpha()
     except Exception as e:
         log(f"Failed to load {filename}: {e}")
         return None
 
+def asset_exists(filename: str) -> bool:
+    """Whether ./assets has filename; a cheap probe that doesn't decode or scan the image."""
+    return os.path.exists(os.path.join(ASSETS_DIR, filename))
+
+def make_static_sprite(surf: pygame.Surface) -> pygame.Surface:
+    """Prepare a sprite that is never modified after loading: display pixel format plus
+    RLE acceleration, so SDL can skip transparent runs when blitting."""
+    try:
+        surf = surf.convert_alpha()
+        surf.set_alpha(255, pygame.RLEACCEL)
+    except Exception:
+        pass
+    return surf
+
 def blit_centered(surf: pygame.Surface, tex: pygame.Surface, x: float, y: float):
     rect = tex.get_rect(center=(int(x), int(y)))
     surf.blit(tex, rect)
@@ -145,20 +251,23 @@ def blit_centered(surf: pygame.Surface, tex: pygame.Surface, x: float, y: float)
 def clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
-def circle_rect_overlap(cx: float, cy: float, r: float, rect: pygame.Rect) -> bool:
-    # Find nearest point on rect to circle center
-    nearest_x = clamp(cx, rect.left, rect.right)
-    nearest_y = clamp(cy, rect.top, rect.bottom)
+def circle_box_overlap(cx: float, cy: float, r: float, left: int, top: int, right: int, bottom: int) -> bool:
+    """Circle vs box given by its edges; pure scalar math, so hot loops can feed it from the obstacle SoA arrays."""
+    # Find nearest point on box to circle center (clamp inlined: called per obstacle per frame)
+    nearest_x = left if cx < left else (right if cx > right else cx)
+    nearest_y = top if cy < top else (bottom if cy > bottom else cy)
     dx = cx - nearest_x
     dy = cy - nearest_y
     return (dx*dx + dy*dy) <= (r*r)
 
-def resolve_circle_rect_collision(cx: float, cy: float, r: float, rect: pygame.Rect, vx: float, vy: float) -> Tuple[float, float, float, float]:
-    """Push circle out of rect and reflect velocity to reduce jitter/edge sticking.
+def resolve_circle_box_collision(cx: float, cy: float, r: float, left: int, top: int, right: int, bottom: int,
+                                 vx: float, vy: float) -> Tuple[float, float, float, float]:
+    """Push circle out of the box given by its edges and reflect velocity to reduce jitter/edge sticking.
+    Scalar-only like circle_box_overlap, so the per-frame resolve never touches a Rect.
     Returns new (cx, cy, vx, vy)
     """
-    nearest_x = clamp(cx, rect.left, rect.right)
-    nearest_y = clamp(cy, rect.top, rect.bottom)
+    nearest_x = left if cx < left else (right if cx > right else cx)
+    nearest_y = top if cy < top else (bottom if cy > bottom else cy)
     nx = cx - nearest_x
     ny = cy - nearest_y
     dist2 = nx*nx + ny*ny
@@ -181,10 +290,104 @@ def resolve_circle_rect_collision(cx: float, cy: float, r: float, rect: pygame.R
         vy = vy - 2*dot*ny
     return cx, cy, vx, vy
 
-def _resolve_font_path(preferred_filename: str | None) -> str:
+def resolve_circle_boxes(cx: float, cy: float, r: float, vx: float, vy: float, lefts: list, tops: list,
+                         rights: list, bottoms: list, passes: int = 4) -> Tuple[float, float, float, float]:
+    """Push a circle out of every overlapping box, in index order, for up to `passes` sweeps (stops early
+    after a sweep with no overlap). State stays in locals for the whole batch. Returns new (cx, cy, vx, vy)."""
+    r2 = r * r
+    edges = tuple(zip(lefts, tops, rights, bottoms))
+    for _ in range(passes):
+        moved = False
+        for left, top, right, bottom in edges:
+            # circle_box_overlap inlined
+            ndx = cx - (left if cx < left else (right if cx > right else cx))
+            ndy = cy - (top if cy < top else (bottom if cy > bottom else cy))
+            if ndx * ndx + ndy * ndy <= r2:
+                cx, cy, vx, vy = resolve_circle_box_collision(cx, cy, r, left, top, right, bottom, vx, vy)
+                moved = True
+        if not moved:
+            break
+    return cx, cy, vx, vy
+
+# System font lookup is deferred and cached on disk: match_font walks the font directories
+FONT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "feed_your_cat", "font_path.txt")
+PREFERRED_FONT_NAMES = ('simsun', 'microsoftyahei')  # CJK-capable system fonts, in order of preference
+_system_font_path = None
+_system_font_resolved = False
+
+def get_system_font_path() -> str | None:
+    """Return the detected system font path (or None for pygame's default font).
+    Resolved on first use only. Only a preferred CJK font hit is persisted to FONT_CACHE_FILE (as
+    "name<TAB>path"); the default-font fallback is always resolved fresh, so a CJK font installed
+    later is still picked up on the next launch.
+    """
+    global _system_font_path, _system_font_resolved
+    if _system_font_resolved:
+        return _system_font_path
+    path = None
+    try:
+        with open(FONT_CACHE_FILE, "r", encoding="utf-8") as f:
+            name, _, cached = f.read().strip().partition("\t")
+        if name in PREFERRED_FONT_NAMES and cached and os.path.exists(cached):
+            path = cached
+    except Exception:
+        pass
+    if path is None:
+        for name in PREFERRED_FONT_NAMES:
+            path = pygame.font.match_font(name)
+            if path:
+                # Best-effort; ignore failures
+                try:
+                    os.makedirs(os.path.dirname(FONT_CACHE_FILE), exist_ok=True)
+                    with open(FONT_CACHE_FILE, "w", encoding="utf-8") as f:
+                        f.write(f"{name}\t{path}")
+                except Exception:
+                    pass
+                break
+        if not path:
+            # If Chinese font not found, use default font (not cached)
+            path = pygame.font.match_font(pygame.font.get_default_font())
+    _system_font_path = path
+    _system_font_resolved = True
+    return path
+
+def hide_spot_xy(left: int, top: int, right: int, bottom: int, cx: int, cy: int,
+                 mx: int, my: int, size: int) -> Tuple[int, int]:
+    """Hide target inside obstacle (left, top, right, bottom) on the far side from the mouse.
+    Pure scalar math (no attribute lookups), used by Game.compute_hide_spot.
+    """
+    width = right - left
+    height = bottom - top
+    dx = (left + width // 2) - mx
+    dy = (top + height // 2) - my
+    # On the far side of the obstacle relative to the mouse, choose a slightly inset point so the center is inside the rect and gets occluded
+    inset_x = max(HIDE_INSET_MIN, min(int(width * HIDE_INSET_FRACTION), size))
+    inset_y = max(HIDE_INSET_MIN, min(int(height * HIDE_INSET_FRACTION), size))
+    if abs(dx) >= abs(dy):
+        # Left/right side hide (interior), allow peeking from left/right, but not from bottom
+        side_sign = 1 if dx >= 0 else -1  # Mouse on left => choose right side
+        tx = (left + width // 2) + side_sign * (width / 2 - inset_x)
+        # y near current value, but force not exceeding obstacle bottom minus cat radius, avoid bottom peek
+        ty = clamp(cy, top + inset_y, bottom - inset_y)
+        safe_bottom_y = bottom - size - 1
+        if safe_bottom_y >= top + inset_y:
+            ty = min(ty, safe_bottom_y)
+        else:
+            # Extreme case: obstacle too short, near top
+            ty = top + inset_y
+    else:
+        # Vertical: force choose top interior (allow top/corner peek, forbid bottom peek)
+        ty = top + inset_y
+        tx = clamp(cx, left + inset_x, right - inset_x)
+    # Final fallback constraint within screen
+    tx = clamp(tx, 0 + size, WIDTH - size)
+    ty = clamp(ty, 60 + size, HEIGHT - size)
+    return (int(tx), int(ty))
+
+def _resolve_font_path(preferred_filename: str | None) -> str | None:
     """Return an absolute font path to use.
-    If a preferred TTF filename exists in assets, use it; otherwise fall back to the
-    detected system font (font_path defined above).
+    If a preferred TTF filename exists in assets, use it (no system font scan); otherwise
+    fall back to the detected system font.
     """
     try:
         if preferred_filename:
@@ -193,7 +396,7 @@ def _resolve_font_path(preferred_filename: str | None) -> str:
                 return p
     except Exception:
         pass
-    return font_path
+    return get_system_font_path()
 
 def draw_pixel_fish(size=20):
     """Draw pixel art fish (dried fish)"""
@@ -305,6 +508,19 @@ except Exception as e:
 
 clock = pygame.time.Clock()
 
+# Event types consumed by Game.handle_events; everything else is discarded each frame
+HANDLED_EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.WINDOWEXPOSED]
+
+# Parsed assets/scenes.json, shared by every Game() (including restarts with R)
+_scenes_config_cache = None
+
+_NEED_DRIFT_LOG_MISS = math.log(1.0 - CAT_NEED_DRIFT_CHANCE)
+
+def need_drift_gap() -> int:
+    """Moves until the next need drift: geometric with CAT_NEED_DRIFT_CHANCE, the same law as one
+    per-move random() < chance check, sampled with a single draw."""
+    return 1 + int(math.log(1.0 - random.random()) / _NEED_DRIFT_LOG_MISS)
+
 class Cat:
     def __init__(self):
         # Initial attributes
@@ -317,6 +533,11 @@ class Cat:
         self.color = (169, 169, 169)  # Gray
         self.hunger = 50  # Hunger 0-100
         self.playfulness = 50  # Playfulness 0-100
+        self._drift_countdown = need_drift_gap()  # Moves until the next random need drift
+        # get_current_need memo: (hunger, playfulness) it was computed for, the answer, and whether it was a tie
+        self._need_sig = None
+        self._need_cached = "food"
+        self._need_tie = False
         self.affinity = 0  # Affinity 0-100
         self.growth_stage = 1  # Growth stage
         # Optional: stage sprites, injected by Game {1: [Surface, Surface], 2: [...], 3: [...]}
@@ -326,55 +547,67 @@ class Cat:
         # Frame-by-frame cache (after size & stage scaling): [[frame0, frame1], flipped same for flipped]
         self._cached_scaled_frames = None
         self._cached_flipped_frames = None
-        # Legacy fields (no longer used)
-        self._cached_scaled = None
-        self._cached_flipped = None  # Horizontal flip cache
+        # Pre-rendered geometric fallback (used without sprite images) and the (size, color) it was drawn for
+        self._fallback_sprite = None
+        self._fallback_sig = None
         self.facing_right = True     # Facing direction, updated based on dx
         # Animation state
         self._anim_frame = 0
         self._anim_counter = 0
-        self._last_draw_pos = (self.x, self.y)
+        # Position at the previous draw, as two floats (no tuple allocated per frame)
+        self._last_draw_x = self.x
+        self._last_draw_y = self.y
         
     def move(self, speed_scale: float = 1.0, check_bounds: bool = True):
         # Remove jitter: no random direction change, only move in current direction at constant speed
 
+        # Position/velocity are read into locals once and written back once (no attribute traffic per test)
+        dx, dy = self.dx, self.dy
         # First update position
-        self.x += self.dx * speed_scale
-        self.y += self.dy * speed_scale
+        x = self.x + dx * speed_scale
+        y = self.y + dy * speed_scale
 
         # Screen boundaries (only active when check_bounds=True)
         if check_bounds:
-            min_x = self.size
-            max_x = WIDTH - self.size
-            min_y = 60 + self.size  # Reserve top toolbar
-            max_y = HEIGHT - self.size
+            size = self.size
+            min_x = size
+            max_x = WIDTH - size
+            min_y = 60 + size  # Reserve top toolbar
+            max_y = HEIGHT - size
 
             # X-axis boundary bounce
-            if self.x < min_x:
-                self.x = min_x
-                self.dx *= -1
-            elif self.x > max_x:
-                self.x = max_x
-                self.dx *= -1
+            if x < min_x:
+                x = min_x
+                dx = -dx
+            elif x > max_x:
+                x = max_x
+                dx = -dx
 
             # Y-axis boundary bounce
-            if self.y < min_y:
-                self.y = min_y
-                self.dy *= -1
-            elif self.y > max_y:
-                self.y = max_y
-                self.dy *= -1
-        
+            if y < min_y:
+                y = min_y
+                dy = -dy
+            elif y > max_y:
+                y = max_y
+                dy = -dy
+        self.x, self.y, self.dx, self.dy = x, y, dx, dy
+
         # Update facing (based on current horizontal velocity)
-        self.facing_right = (self.dx >= 0)
+        self.facing_right = (dx >= 0)
             
-        # Randomly change needs
-        if random.random() < 0.01:
-            self.hunger = min(100, self.hunger + random.randint(1, 3))
-            self.playfulness = max(0, self.playfulness - random.randint(1, 2))
-        if random.random() < 0.01:
-            self.playfulness = min(100, self.playfulness + random.randint(1, 3))
-            self.hunger = max(0, self.hunger - random.randint(1, 2))
+        # Randomly change needs: the gap to the next drift is pre-sampled, so ordinary moves only count down
+        # (the kind and step sizes are drawn on drift moves, from random() instead of the slower randint)
+        self._drift_countdown -= 1
+        if self._drift_countdown <= 0:
+            self._drift_countdown = need_drift_gap()
+            rand = random.random
+            up, down = 1 + int(rand() * 3), 1 + int(rand() * 2)  # 1-3 up, 1-2 down
+            if rand() < 0.5:
+                self.hunger = min(100, self.hunger + up)
+                self.playfulness = max(0, self.playfulness - down)
+            else:
+                self.playfulness = min(100, self.playfulness + up)
+                self.hunger = max(0, self.hunger - down)
             
     def grow(self):
         # Growth logic: speed increases on each level up
@@ -399,8 +632,12 @@ class Cat:
                 self.dy = (self.dy / old_speed) * self.speed
             self.color = (100, 100, 100)  # darker gray
             
-    def draw(self):
+    def draw(self, pending: list | None = None):
         # Note: drawing uses world coordinates, caller will convert via camera
+        # With a pending list the sprite blit is queued for the caller's blits() batch instead of drawn now
+        # Read and snap the position once; it can change outside move() (hiding, push-out)
+        x, y = self.x, self.y
+        ix, iy = int(x), int(y)
         # If sprite exists, draw sprite first (cached by stage & size scaling), with two-frame walk animation
         if self.sprite_images and isinstance(self.sprite_images, dict):
             frames = self.sprite_images.get(self.growth_stage)
@@ -421,9 +658,10 @@ class Cat:
                         self._cached_scaled_frames = None
                         self._cached_flipped_frames = None
                     self._cache_key = key
-                # Animation update: determine walking based on displacement
-                moved_dist = math.hypot(self.x - self._last_draw_pos[0], self.y - self._last_draw_pos[1])
-                is_moving = moved_dist > 0.2
+                # Animation update: determine walking based on displacement (squared, vs 0.2 px)
+                mdx = x - self._last_draw_x
+                mdy = y - self._last_draw_y
+                is_moving = mdx * mdx + mdy * mdy > 0.04
                 if is_moving:
                     self._anim_counter += 1
                     if self._anim_counter >= CAT_WALK_ANIM_INTERVAL_FRAMES:
@@ -432,7 +670,8 @@ class Cat:
                 else:
                     self._anim_counter = 0
                     self._anim_frame = 0
-                self._last_draw_pos = (self.x, self.y)
+                self._last_draw_x = x
+                self._last_draw_y = y
                 # Select facing direction and current animation frame
                 if self._cached_scaled_frames is not None and self._cached_flipped_frames is not None:
                     if self.facing_right:
@@ -440,25 +679,98 @@ class Cat:
                     else:
                         chosen = self._cached_flipped_frames[self._anim_frame]
                     if chosen is not None:
-                        blit_centered(screen, chosen, self.x, self.y)
+                        if pending is not None:
+                            pending.append((chosen, chosen.get_rect(center=(ix, iy))))
+                        else:
+                            screen.blit(chosen, chosen.get_rect(center=(ix, iy)))
                         return
-        # Fallback: draw default geometric cat
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size)
-        eye_offset = self.size // 3
-        pygame.draw.circle(screen, WHITE, (int(self.x) - eye_offset, int(self.y) - eye_offset//2), self.size // 6)
-        pygame.draw.circle(screen, WHITE, (int(self.x) + eye_offset, int(self.y) - eye_offset//2), self.size // 6)
-        pygame.draw.circle(screen, BLACK, (int(self.x) - eye_offset, int(self.y) - eye_offset//2), self.size // 12)
-        pygame.draw.circle(screen, BLACK, (int(self.x) + eye_offset, int(self.y) - eye_offset//2), self.size // 12)
-        pygame.draw.line(screen, BLACK, (int(self.x), int(self.y)), (int(self.x), int(self.y) + self.size//4), 2)
+        # Fallback: default geometric cat, pre-rendered once per (size, color) and blitted like a sprite
+        sig = (self.size, self.color)
+        if sig != self._fallback_sig:
+            self._fallback_sprite = self._render_fallback_sprite()
+            self._fallback_sig = sig
+        r = max(int(self.size), 1) + 2  # Sprite margin, same as bounds()
+        if pending is not None:
+            pending.append((self._fallback_sprite, (ix - r, iy - r)))
+        else:
+            screen.blit(self._fallback_sprite, (ix - r, iy - r))
+
+    def _render_fallback_sprite(self) -> pygame.Surface:
+        """Geometric cat (body, eyes, mouth) drawn once onto a transparent surface centered on the cat."""
+        size = self.size
+        r = max(int(size), 1) + 2
+        surf = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+        ix = iy = r
+        circle = pygame.draw.circle
+        circle(surf, self.color, (ix, iy), size)
+        eye_offset = size // 3
+        eye_y = iy - eye_offset // 2
+        circle(surf, WHITE, (ix - eye_offset, eye_y), size // 6)
+        circle(surf, WHITE, (ix + eye_offset, eye_y), size // 6)
+        circle(surf, BLACK, (ix - eye_offset, eye_y), size // 12)
+        circle(surf, BLACK, (ix + eye_offset, eye_y), size // 12)
+        pygame.draw.line(surf, BLACK, (ix, iy), (ix, iy + size//4), 2)
+        return surf
         
+    def bounds(self) -> pygame.Rect:
+        """Screen rect covering everything draw() paints at the current position."""
+        ix, iy = int(self.x), int(self.y)
+        r = max(int(self.size), 1) + 2
+        return pygame.Rect(ix - r, iy - r, 2 * r + 1, 2 * r + 1)
+
     def get_current_need(self):
-        # Determine current main need
-        if self.hunger > self.playfulness + 20:
-            return "food"  # needs food
-        elif self.playfulness > self.hunger + 20:
-            return "toy"   # needs toy
-        else:
-            return random.choice(["food", "toy"])  # balanced needs, random choice
+        # Determine current main need; recomputed only when hunger/playfulness change, so every caller
+        # within the same state (bubble, throw, collision) sees the same answer
+        sig = (self.hunger, self.playfulness)
+        if sig != self._need_sig:
+            self._need_sig = sig
+            if self.hunger > self.playfulness + 20:
+                self._need_cached = "food"  # needs food
+                self._need_tie = False
+            elif self.playfulness > self.hunger + 20:
+                self._need_cached = "toy"   # needs toy
+                self._need_tie = False
+            elif not self._need_tie:
+                # Balanced needs: random choice, rolled once when the tie appears and kept while it lasts
+                self._need_cached = random.choice(["food", "toy"])
+                self._need_tie = True
+        return self._need_cached
+
+class ThrownItem:
+    """One thrown food/toy: flight state (position, height z, velocities) plus draw data.
+    Slotted, so the per-frame update/draw loops read fields as attributes instead of dict keys."""
+    __slots__ = ("type", "x", "y", "z", "target_x", "target_y", "start_x", "start_y", "speed",
+                 "vx", "vy", "vz", "gravity", "rotation", "rotation_speed", "bounce_count",
+                 "radius", "color", "thrown", "game_ref", "expected_need", "image", "state",
+                 "lifetime", "blocked")
+
+    def __init__(self, item_type, x, y, target_x, target_y, vx, vy, rotation_speed, radius, color,
+                 game_ref, expected_need, image):
+        self.type = item_type
+        self.x = x
+        self.y = y
+        self.z = 0  # Add height dimension
+        self.target_x = target_x
+        self.target_y = target_y
+        self.start_x = x
+        self.start_y = y
+        self.speed = 8
+        self.vx = vx  # x-direction velocity
+        self.vy = vy  # y-direction velocity
+        self.vz = 3.0  # Initial vertical velocity (upward)
+        self.gravity = 0.15  # Gravity acceleration
+        self.rotation = 0  # Rotation angle
+        self.rotation_speed = rotation_speed  # Rotation speed
+        self.bounce_count = 0  # Bounce count
+        self.radius = radius
+        self.color = color
+        self.thrown = True
+        self.game_ref = game_ref
+        self.expected_need = expected_need
+        self.image = image
+        self.state = "flying"  # State: flying or landed
+        self.lifetime = 600  # Lifetime (frames), disappears after ~10 seconds
+        self.blocked = False  # Landed on an obstacle (reported once by update_items)
 
 class Player:
     def __init__(self):
@@ -469,6 +781,11 @@ class Player:
         self.consecutive_wrong = 0  # consecutive wrong hits
         # Optional: item images, loaded and injected by Game
         self.item_images = {"food": None, "toy": None}
+        # Pre-rendered small sprites for draw_items: (shadow_size, shadow_alpha) -> shadow, (color, radius) -> disc
+        self._shadow_sprites = {}
+        self._disc_sprites = {}
+        # Scaled throw sprite per item type: type -> (source image it was scaled from, scaled Surface or None)
+        self._item_sprites = {}
         
     def throw_item(self, mouse_pos, cat_pos, game_ref=None):
         # Throw item
@@ -479,164 +796,211 @@ class Player:
             except Exception:
                 expected_need = None
         radius = 10
-        # Pre-scale item sprite (if exists)
-        base_img = self.item_images.get(self.selected_item)
-        scaled_img = None
-        
-        # Prefer pixel art if available, use pixel pattern if no assets
-        if base_img is None:
-            # Use pixel art drawing
-            if self.selected_item == "food":
-                base_img = draw_pixel_fish(20)
-            else:  # toy
-                base_img = draw_pixel_toy(20)
-        
-        if base_img is not None:
-            try:
-                wh = max(2 * radius, 2)
-                # Visual scaling by type
-                item_extra = ITEM_IMAGE_SCALE.get(self.selected_item, 1.0)
-                if item_extra != 1.0:
-                    wh = max(1, int(round(wh * item_extra)))
-                scaled_img = pygame.transform.smoothscale(base_img, (wh, wh))
-            except Exception as e:
-                log(f"Scale item image failed: {e}")
-                scaled_img = None
+        # Pre-scale item sprite (if exists); scaled once per item type and reused by every throw
+        # (items only blit or rotate-copy it), redone only if the injected source image changes
+        src_img = self.item_images.get(self.selected_item)
+        cached = self._item_sprites.get(self.selected_item)
+        if cached is not None and cached[0] is src_img:
+            scaled_img = cached[1]
+        else:
+            base_img = src_img
+            scaled_img = None
+            
+            # Prefer pixel art if available, use pixel pattern if no assets
+            if base_img is None:
+                # Use pixel art drawing
+                if self.selected_item == "food":
+                    base_img = draw_pixel_fish(20)
+                else:  # toy
+                    base_img = draw_pixel_toy(20)
+            
+            if base_img is not None:
+                try:
+                    wh = max(2 * radius, 2)
+                    # Visual scaling by type
+                    item_extra = ITEM_IMAGE_SCALE.get(self.selected_item, 1.0)
+                    if item_extra != 1.0:
+                        wh = max(1, int(round(wh * item_extra)))
+                    scaled_img = pygame.transform.smoothscale(base_img, (wh, wh))
+                except Exception as e:
+                    log(f"Scale item image failed: {e}")
+                    scaled_img = None
+            self._item_sprites[self.selected_item] = (src_img, scaled_img)
         # Calculate parabolic motion parameters
         dx = cat_pos[0] - mouse_pos[0]
         dy = cat_pos[1] - mouse_pos[1]
-        distance = math.sqrt(dx*dx + dy*dy)
-        flight_time = max(30, distance / 8)  # Flight time (frames)
+        # Flight time (frames): max(30, distance / 8); throws within 240 px get the 30-frame floor,
+        # so the squared distance decides that case and sqrt only runs for longer throws
+        dist2 = dx*dx + dy*dy
+        flight_time = 30 if dist2 <= 240 * 240 else math.sqrt(dist2) / 8
         
-        item = {
-            "type": self.selected_item,
-            "x": mouse_pos[0],
-            "y": mouse_pos[1],
-            "z": 0,  # Add height dimension
-            "target_x": cat_pos[0],
-            "target_y": cat_pos[1],
-            "start_x": mouse_pos[0],
-            "start_y": mouse_pos[1],
-            "speed": 8,
-            "vx": dx / flight_time,  # x-direction velocity
-            "vy": dy / flight_time,  # y-direction velocity
-            "vz": 3.0,  # Initial vertical velocity (upward)
-            "gravity": 0.15,  # Gravity acceleration
-            "rotation": 0,  # Rotation angle
-            "rotation_speed": random.uniform(5, 15) * random.choice([-1, 1]),  # Rotation speed
-            "bounce_count": 0,  # Bounce count
-            "radius": radius,
-            "color": GREEN if self.selected_item == "food" else YELLOW,
-            "thrown": True,
-            "game_ref": game_ref,
-            "expected_need": expected_need,
-            "image": scaled_img,
-            "state": "flying",  # State: flying or landed
-            "lifetime": 600,  # Lifetime (frames), disappears after ~10 seconds
-        }
+        item = ThrownItem(
+            self.selected_item, mouse_pos[0], mouse_pos[1], cat_pos[0], cat_pos[1],
+            dx / flight_time, dy / flight_time,
+            random.uniform(5, 15) * random.choice([-1, 1]),
+            radius, GREEN if self.selected_item == "food" else YELLOW,
+            game_ref, expected_need, scaled_img,
+        )
         self.thrown_items.append(item)
         
-    def update_items(self):
-        # Update thrown item positions
-        for item in self.thrown_items[:]:
-            if item["state"] == "landed":
+    def update_items(self) -> list:
+        # Update thrown item positions; every item advances each frame
+        # Returns this frame's events: items that landed near their target, and items flagged
+        # .blocked that hit an obstacle
+        # Single compacting pass: surviving items are collected in order and written back in place,
+        # instead of copying the list every frame and remove()-ing (O(n) each) expired items
+        items = self.thrown_items
+        events = []
+        if not items:
+            return events
+        keep = []
+        for item in items:
+            if item.state == "landed":
                 # Landed items decrease lifetime, add fade-out effect
-                item["lifetime"] -= 1
-                if item["lifetime"] <= 0:
-                    self.thrown_items.remove(item)
+                item.lifetime -= 1
+                if item.lifetime > 0:
+                    keep.append(item)
                 continue
+            keep.append(item)
             
             # Flying items - use parabolic motion
+            # Work on locals and write back once (avoids repeated attribute loads/stores per field)
+            vx, vy, vz = item.vx, item.vy, item.vz
             # Update rotation angle
-            item["rotation"] += item["rotation_speed"]
+            item.rotation += item.rotation_speed
             
             # Update position (parabola)
-            item["x"] += item["vx"]
-            item["y"] += item["vy"]
-            item["z"] += item["vz"]
-            item["vz"] -= item["gravity"]  # Gravity effect
+            x = item.x + vx
+            y = item.y + vy
+            z = item.z + vz
+            vz -= item.gravity  # Gravity effect
+            item.x = x
+            item.y = y
+            item.z = z
+            item.vz = vz
             
             # Check if landed (z <= 0)
-            if item["z"] <= 0:
-                item["z"] = 0
-                item["bounce_count"] += 1
+            if z <= 0:
+                z = item.z = 0
+                item.bounce_count += 1
                 
                 # Bounce effect
-                if item["bounce_count"] <= 2 and abs(item["vz"]) > 0.5:
+                if item.bounce_count <= 2 and abs(vz) > 0.5:
                     # Bounce back, lose energy each time
-                    item["vz"] = -item["vz"] * 0.5
-                    item["vx"] *= 0.7  # Horizontal velocity decay
-                    item["vy"] *= 0.7
-                    item["rotation_speed"] *= 0.7
+                    item.vz = -vz * 0.5
+                    item.vx = vx * 0.7  # Horizontal velocity decay
+                    item.vy = vy * 0.7
+                    item.rotation_speed *= 0.7
                 else:
                     # Stop bouncing, mark as landed
-                    item["state"] = "landed"
-                    item["vx"] = 0
-                    item["vy"] = 0
-                    item["vz"] = 0
-                    item["rotation_speed"] = 0
+                    item.state = "landed"
+                    item.vx = 0
+                    item.vy = 0
+                    item.vz = 0
+                    item.rotation_speed = 0
                     
                     # Check if reached target position (near cat)
-                    dx = item["x"] - item["target_x"]
-                    dy = item["y"] - item["target_y"]
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    if distance < 30:  # Landed near target
-                        return item
+                    dx = x - item.target_x
+                    dy = y - item.target_y
+                    if dx*dx + dy*dy < 900:  # Landed near target (within 30 px)
+                        events.append(item)
+                        continue
             
-            # Check obstacle collision
-            if 'game_ref' in item and item['game_ref'] is not None:
-                game = item['game_ref']
-                for rect in game.obstacles:
-                    if rect.collidepoint(int(item["x"]), int(item["y"])) and item["z"] < 20:
-                        # Hit obstacle, land immediately
-                        item["state"] = "landed"
-                        item["z"] = 0
-                        item["vx"] = 0
-                        item["vy"] = 0
-                        item["vz"] = 0
-                        # Mark field in return value to notify outer layer to show message
-                        item_copy = dict(item)
-                        item_copy['_blocked'] = True
-                        return item_copy
-        return None
+            # Check obstacle collision (only low items can hit; test height before the rect scan)
+            game = item.game_ref
+            if game is not None and z < 20:
+                # Items outside the obstacles' bounding box skip the scan; otherwise one C-level scan:
+                # a 1x1 rect at the point meets exactly the rects that collidepoint() would
+                ix, iy = int(x), int(y)
+                ox0, oy0, ox1, oy1 = game._obs_extent
+                if (ox0 <= ix < ox1 and oy0 <= iy < oy1
+                        and pygame.Rect(ix, iy, 1, 1).collidelist(game.obstacles) != -1):
+                    # Hit obstacle, land immediately
+                    item.state = "landed"
+                    item.z = 0
+                    item.vx = 0
+                    item.vy = 0
+                    item.vz = 0
+                    # Mark the item so the outer layer shows the blocked message (landed items report no more events)
+                    item.blocked = True
+                    events.append(item)
+        items[:] = keep
+        return events
         
-    def draw_items(self):
+    def draw_items(self, pending: list | None = None):
         # Draw thrown items (with shadow, height and rotation effects)
+        # Sprite blits are queued and submitted in one blits() call (doreturn=0 skips Rect creation);
+        # a caller-supplied pending list is left unsubmitted so it can be batched with other layers
+        owns_batch = pending is None
+        if owns_batch:
+            pending = []
+        shadow_sprites = self._shadow_sprites
         for item in self.thrown_items:
-            x = int(item["x"])
-            y = int(item["y"])
-            z = item.get("z", 0)
+            x = int(item.x)
+            y = int(item.y)
+            z = item.z
             
             # Draw shadow (below item)
             if z > 0:
                 shadow_y = y  # Shadow always on ground
-                shadow_size = max(3, int(item["radius"] * (1 - z / 100)))  # Higher = smaller shadow
+                shadow_size = max(3, int(item.radius * (1 - z / 100)))  # Higher = smaller shadow
                 shadow_alpha = int(100 * (1 - z / 150))  # Higher = lighter shadow
                 if shadow_alpha > 0:
-                    shadow_surf = pygame.Surface((shadow_size * 2, shadow_size), pygame.SRCALPHA)
-                    pygame.draw.ellipse(shadow_surf, (0, 0, 0, shadow_alpha), 
-                                      (0, 0, shadow_size * 2, shadow_size))
-                    screen.blit(shadow_surf, (x - shadow_size, shadow_y - shadow_size // 2))
+                    # Shadows take a small set of (size, alpha) values: render each once, not per item per frame
+                    shadow_key = (shadow_size, shadow_alpha)
+                    shadow_surf = shadow_sprites.get(shadow_key)
+                    if shadow_surf is None:
+                        shadow_surf = pygame.Surface((shadow_size * 2, shadow_size), pygame.SRCALPHA)
+                        pygame.draw.ellipse(shadow_surf, (0, 0, 0, shadow_alpha),
+                                          (0, 0, shadow_size * 2, shadow_size))
+                        shadow_sprites[shadow_key] = shadow_surf
+                    pending.append((shadow_surf, (x - shadow_size, shadow_y - shadow_size // 2)))
             
             # Calculate item display position (considering height)
             display_y = int(y - z)
             
             # Draw item
-            img = item.get("image")
-            rotation = item.get("rotation", 0)
+            img = item.image
+            rotation = item.rotation
             
             if img is not None:
                 # Rotate image
-                if rotation != 0 and item["state"] == "flying":
+                if rotation != 0 and item.state == "flying":
                     rotated_img = pygame.transform.rotate(img, rotation)
-                    rect = rotated_img.get_rect(center=(x, display_y))
-                    screen.blit(rotated_img, rect)
+                    pending.append((rotated_img, rotated_img.get_rect(center=(x, display_y))))
                 else:
-                    blit_centered(screen, img, x, display_y)
+                    pending.append((img, img.get_rect(center=(x, display_y))))
             else:
-                # Draw circle (if no image)
-                pygame.draw.circle(screen, item["color"], (x, display_y), item["radius"])
+                # Circle (if no image), pre-rendered per (color, radius) so it joins the same batch
+                radius = item.radius
+                disc_key = (item.color, radius)
+                disc = self._disc_sprites.get(disc_key)
+                if disc is None:
+                    disc = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+                    pygame.draw.circle(disc, item.color, (radius, radius), radius)
+                    self._disc_sprites[disc_key] = disc
+                pending.append((disc, (x - radius, display_y - radius)))
+        if owns_batch and pending:
+            screen.blits(pending, 0)
             
+    def items_bounds(self) -> pygame.Rect | None:
+        """Union rect covering everything draw_items() paints (shadows and rotated sprites), None if no items."""
+        rects = []
+        for item in self.thrown_items:
+            x = int(item.x)
+            y = int(item.y)
+            radius = item.radius
+            img = item.image
+            # A rotated w x h sprite never exceeds its diagonal, which is <= w + h
+            half = (img.get_width() + img.get_height()) // 2 + 2 if img is not None else radius + 2
+            rects.append(pygame.Rect(x - half, int(y - item.z) - half, 2 * half + 1, 2 * half + 1))
+            # Shadow stays on the ground and is never larger than the item radius
+            r = max(3, radius) + 1
+            rects.append(pygame.Rect(x - r, y - r, 2 * r + 1, 2 * r + 1))
+        if not rects:
+            return None
+        return rects[0].unionall(rects[1:])
+
     def switch_item(self):
         # Switch item
         self.selected_item = "toy" if self.selected_item == "food" else "food"
@@ -667,8 +1031,30 @@ class Game:
             self.large_font = pygame.font.Font(title_font_path, max(1, int(FONT_TITLE_SIZE)))
         except Exception:
             # Fallback: still use system font
-            self.font = pygame.font.Font(font_path, 18)
-            self.large_font = pygame.font.Font(font_path, 32)
+            self.font = pygame.font.Font(get_system_font_path(), 18)
+            self.large_font = pygame.font.Font(get_system_font_path(), 32)
+        # Rendered text, keyed by (text, color, font)
+        self._text_cache = OrderedDict()
+        # Composed toolbar and the displayed values it was built from
+        self._toolbar_key = None
+        self._toolbar_surf = None
+        # Toolbar label surfaces, one slot per field: (text, color, surface)
+        self._ui_surfs = {}
+        # Semi-transparent full-screen overlays (start / game over / paused), allocated once
+        self._overlay_start = self._make_overlay(140)
+        self._overlay_game_over = self._make_overlay(120)
+        self._overlay_paused = self._make_overlay(100)
+        # Static screen text, rendered once
+        self._start_screen_blits = self._layout_start_screen()
+        self._game_over_hint_surf = self.font.render("Press R to restart / Esc to exit", True, WHITE)
+        self._paused_surf = self.large_font.render("Paused", True, WHITE)
+        self._paused_hint_surf = self.font.render("Press Z to resume", True, WHITE)
+        # Frozen screen ('start' / 'over' / 'paused') currently presented; while it stays the same nothing is redrawn
+        self._static_frame = None
+        # Last presented gameplay frame: the scene layer it was composed on and the screen rects it drew over
+        # that layer; a frame on the same layer only pushes those rects (old and new) to the display
+        self._presented_layer = None
+        self._presented_rects = []
         # Define obstacles (rectangles), below toolbar, distributed on large map
         self.obstacles = [
             # Top-left area
@@ -687,8 +1073,19 @@ class Game:
             pygame.Rect(WIDTH + 300, HEIGHT + 150, 160, 100),
         ]
         self.obstacle_color = (120, 120, 120)
+        # Render resources, filled by _load_assets/load_scene (None/empty = fallback drawing)
+        self.background_normal = None
+        self.background_winter = None
+        self.obstacle_images = []
+        self.obstacle_surfs = []
+        # Full-screen scene layers keyed by with_obstacles (False: background only, True: background + obstacles)
+        self._scene_layers = {}
+        # Cross-fade surfaces baked once per blend step: {(tex, alpha): Surface, ("background", bn, bw, step): Surface};
+        # keyed by scene surfaces, so cleared whenever the scene or map changes
+        self._season_blend_cache = {}
         # Load PNG assets (fallback to default graphics if not found)
         self._load_assets()
+        self._rebuild_obstacle_geometry()
         # Hide-and-seek state
         self.hide_target = None  # (x, y)
         self.hide_frames = 0     # Remaining hide frames (1-2 seconds)
@@ -699,17 +1096,24 @@ class Game:
         self.idle_frames = 0
         # Dialog text (avoid frequent jitter, refresh randomly every 3-5 seconds)
         initial_need = self.cat.get_current_need()
-        self.need_text = "I want food!" if initial_need == "food" else "I want a toy!"
+        self.need_text = NEED_TEXTS[initial_need]
         self._need_frames_left = random.randint(BUBBLE_REFRESH_MIN_FRAMES, BUBBLE_REFRESH_MAX_FRAMES)
         # Bubble position & direction (smooth following, sticky orientation)
-        self._bubble_pos = None  # type: ignore
+        self._bubble_pos = None  # type: ignore  # [x, y] in Q8 fixed point (1/256 px)
+        # need_text -> pre-rendered bubble body Surface; both needs are composed up front
+        self._bubble_cache = {text: self._compose_bubble_body(text) for text in NEED_TEXTS.values()}
         self.bubble_side = 'top'
+        self._bubble_layout = None  # (cat_x, cat_y, mouse_x, mouse_y, text) at the last side selection
+        self._bubble_tails = {}  # edge side -> (tail Surface, dx, dy)
         # Game flow state
         self.time_left = GAME_DURATION_FRAMES
         self.loss_grace = LOSS_GRACE_FRAMES
         self.game_over = False
         self.game_result = None  # 'win' | 'lose' | 'summary'
         self.end_message = ""
+        # Latest feedback message and the gameplay frames it stays on screen
+        self._message = ""
+        self._message_frames = 0
         # Target for minimum "complete hide" count
         self.min_hide_goal = 3
         self.hide_completed = 0           # Completed hide count
@@ -719,6 +1123,7 @@ class Game:
         self.season_mix = 0.0
         self._season_direction = 1  # 1 -> winter, -1 -> normal
         self._season_hold = SEASON_HOLD_FRAMES
+        self._season_idle = False  # True once stopped at an endpoint (no auto-cycle): _update_season does nothing
         
         # Map switching system
         self.map_transition_timer = SCENE_SWITCH_INTERVAL  # Frames remaining until next auto-leave (20 seconds)
@@ -732,23 +1137,131 @@ class Game:
         
         # Crosshair/targeting effect (pixel style)
         self.target_blink = 0  # Blink counter
+        # Mouse position, seeded once and then tracked from MOUSEMOTION events (no per-frame SDL polling)
+        self._mouse_pos = pygame.mouse.get_pos()
+
+    def _rebuild_obstacle_geometry(self):
+        """Refresh per-obstacle geometry arrays (SoA of centers); call whenever self.obstacles changes."""
+        # Single pass over (x, y, w, h); edges and centers derived with Rect's integer semantics
+        xs, ys, ws, hs = zip(*self.obstacles) if self.obstacles else ((), (), (), ())
+        self._obs_l = list(xs)
+        self._obs_t = list(ys)
+        self._obs_r = [x + w for x, w in zip(xs, ws)]
+        self._obs_b = [y + h for y, h in zip(ys, hs)]
+        self._obs_cx = [x + w // 2 for x, w in zip(xs, ws)]
+        self._obs_cy = [y + h // 2 for y, h in zip(ys, hs)]
+        # Spatial index for nearest-center queries: obstacle indices sorted by center x
+        self._obs_order_x = sorted(range(len(self.obstacles)), key=self._obs_cx.__getitem__)
+        self._obs_sorted_cx = [self._obs_cx[i] for i in self._obs_order_x]
+        # Broad-phase index for box queries: indices sorted by left edge, plus the widest obstacle
+        self._obs_order_l = sorted(range(len(self.obstacles)), key=self._obs_l.__getitem__)
+        self._obs_sorted_l = [self._obs_l[i] for i in self._obs_order_l]
+        self._obs_max_w = max(ws, default=0)
+        # Bounding box of all obstacles (l, t, r, b): points outside it cannot hit any obstacle
+        self._obs_extent = ((min(xs), min(ys), max(self._obs_r), max(self._obs_b))
+                            if self.obstacles else (0, 0, 0, 0))
+        # Memoized nearest obstacle: (cell_x, cell_y, index); stale once obstacles change
+        self._near_cache = (None, None, -1)
+        # Old-system steady-state draw lists, built lazily per season endpoint: use_winter -> (bounds, entries)
+        self._obs_draw_lists = {}
+
+    def _obstacles_in_box(self, x0: float, y0: float, x1: float, y1: float) -> list:
+        """Ascending indices of obstacles whose rect (edges inclusive) meets the box [x0, x1] x [y0, y1].
+        Only lefts within [x0 - widest, x1] can reach the box, so bisect the left-sorted index first.
+        """
+        sorted_l = self._obs_sorted_l
+        lo = bisect_left(sorted_l, x0 - self._obs_max_w)
+        hi = bisect_right(sorted_l, x1)
+        # Common case (nothing within reach on x): no slice, filter or sort at all
+        if lo >= hi:
+            return []
+        obs_t, obs_r, obs_b = self._obs_t, self._obs_r, self._obs_b
+        hits = [i for i in self._obs_order_l[lo:hi]
+                if obs_r[i] >= x0 and obs_b[i] >= y0 and obs_t[i] <= y1]
+        if len(hits) > 1:
+            hits.sort()
+        return hits
+
+    def _nearest_obstacle_index(self, cx: float, cy: float) -> int:
+        """Index of the obstacle whose center is closest to (cx, cy); ties go to the lowest index.
+        Walks outward from cx in the x-sorted index and stops once the x gap alone exceeds the best distance.
+        """
+        order, sorted_cx, obs_cy = self._obs_order_x, self._obs_sorted_cx, self._obs_cy
+        n = len(order)
+        best_d2, best_i = math.inf, -1
+        lo = bisect_left(sorted_cx, cx) - 1
+        hi = lo + 1
+        while lo >= 0 or hi < n:
+            if lo >= 0:
+                gx = sorted_cx[lo] - cx
+                if gx * gx > best_d2:
+                    lo = -1
+                else:
+                    i = order[lo]
+                    gy = obs_cy[i] - cy
+                    d2 = gx * gx + gy * gy
+                    if d2 < best_d2 or (d2 == best_d2 and i < best_i):
+                        best_d2, best_i = d2, i
+                    lo -= 1
+            if hi < n:
+                gx = sorted_cx[hi] - cx
+                if gx * gx > best_d2:
+                    hi = n
+                else:
+                    i = order[hi]
+                    gy = obs_cy[i] - cy
+                    d2 = gx * gx + gy * gy
+                    if d2 < best_d2 or (d2 == best_d2 and i < best_i):
+                        best_d2, best_i = d2, i
+                    hi += 1
+        return best_i
+
+    def _layout_start_screen(self):
+        """Render the start screen text and return it as a blits() sequence of (surface, pos)."""
+        title = "FEED YOUR CAT"
+        sub = "Press Enter or Click to Start"
+        # Control instructions one operation per line, centered row by row
+        ctrl_lines = [
+            "Left Click = Throw",
+            "Space = Switch Item",
+            "Z = Pause/Resume"
+        ]
+        t_surf = self.large_font.render(title, True, WHITE)
+        s_surf = self.font.render(sub, True, WHITE)
+        ctrl_surfs = [self.font.render(line, True, WHITE) for line in ctrl_lines]
+        # Vertically centered layout within safe area, avoid edge occlusion
+        safe_top = 70
+        safe_bottom = HEIGHT - 20
+        spacing = 12
+        block_h = (
+            t_surf.get_height()
+            + spacing + s_surf.get_height()
+            + spacing * len(ctrl_surfs) + sum(cs.get_height() for cs in ctrl_surfs)
+        )
+        y = max(safe_top, min((HEIGHT - block_h) // 2, safe_bottom - block_h))
+        cx = WIDTH // 2
+        blits = []
+        # Title, subtitle, then control instructions (one operation per line)
+        for surf in [t_surf, s_surf] + ctrl_surfs:
+            blits.append((surf, (cx - surf.get_width() // 2, y)))
+            y += surf.get_height() + spacing
+        return blits
+
+    @staticmethod
+    def _make_overlay(alpha: int) -> pygame.Surface:
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        overlay.fill((0, 0, 0, alpha))
+        return overlay
 
     def ensure_open_spot(self):
         """Move cat from obstacle interior to unobstructed position, and ensure not entering toolbar area."""
+        cat = self.cat
         # First constrain to screen visible area (not toolbar)
-        self.cat.x = clamp(self.cat.x, self.cat.size, WIDTH - self.cat.size)
-        self.cat.y = clamp(self.cat.y, 60 + self.cat.size, HEIGHT - self.cat.size)
-        # If overlaps obstacle, use collision pushout several times
-        for _ in range(4):
-            moved = False
-            for rect in self.obstacles:
-                if circle_rect_overlap(self.cat.x, self.cat.y, self.cat.size, rect):
-                    nx, ny, vx, vy = resolve_circle_rect_collision(self.cat.x, self.cat.y, self.cat.size, rect, self.cat.dx, self.cat.dy)
-                    self.cat.x, self.cat.y = nx, ny
-                    self.cat.dx, self.cat.dy = vx, vy
-                    moved = True
-            if not moved:
-                break
+        cat.x = clamp(cat.x, cat.size, WIDTH - cat.size)
+        cat.y = clamp(cat.y, 60 + cat.size, HEIGHT - cat.size)
+        # If overlaps obstacle, use collision pushout several times (one batched call over the edge arrays)
+        cat.x, cat.y, cat.dx, cat.dy = resolve_circle_boxes(
+            cat.x, cat.y, cat.size, cat.dx, cat.dy, self._obs_l, self._obs_t, self._obs_r, self._obs_b)
 
     def _load_assets(self):
         """Load PNG assets and inject into Cat/Player/obstacle drawing with fallbacks."""
@@ -799,7 +1312,7 @@ class Game:
                 new_h = max(1, int(round(new_h * extra)))
             scaler = pygame.transform.smoothscale if OBSTACLE_IMAGE_FILTER == 'smooth' else pygame.transform.scale
             try:
-                scaled = scaler(tex, (new_w, new_h))
+                scaled = make_static_sprite(scaler(tex, (new_w, new_h)))
             except Exception:
                 return None
             if OBSTACLE_IMAGE_ALIGN == 'bottom':
@@ -820,7 +1333,7 @@ class Game:
             tex_norm = load_image(name_norm) or shared_norm
             entry = None
             if tex_norm:
-                entry = {"normal": prepare_scaled(tex_norm, r, i, name_norm if load_image(name_norm) else "obstacle.png"), "winter": None}
+                entry = {"normal": prepare_scaled(tex_norm, r, i, name_norm if asset_exists(name_norm) else "obstacle.png"), "winter": None}
             # winter
             name_win_a = f"obstacle_{i+1}_winter.png"
             name_win_b = f"obstacle_{i+1}_snow.png"
@@ -829,9 +1342,9 @@ class Game:
                 if entry is None:
                     entry = {"normal": None, "winter": None}
                 win_src = (
-                    name_win_a if load_image(name_win_a) else (
-                        name_win_b if load_image(name_win_b) else (
-                            "obstacle_winter.png" if load_image("obstacle_winter.png") else "obstacle_snow.png"
+                    name_win_a if asset_exists(name_win_a) else (
+                        name_win_b if asset_exists(name_win_b) else (
+                            "obstacle_winter.png" if asset_exists("obstacle_winter.png") else "obstacle_snow.png"
                         )
                     )
                 )
@@ -856,7 +1369,7 @@ class Game:
             
             # Try loading multiple background images
             for i in range(1, 11):
-                bg_img = load_image(f"background_{i}.png")
+                bg_img = load_image(f"background_{i}.png", alpha=False)
                 if bg_img is not None:
                     try:
                         scaled_bg = pygame.transform.smoothscale(bg_img, (WIDTH, HEIGHT))
@@ -866,7 +1379,7 @@ class Game:
             
             # If no numbered background found, load default background
             if not self.background_list:
-                bg_norm = load_image("background.png")
+                bg_norm = load_image("background.png", alpha=False)
                 if bg_norm is not None:
                     try:
                         self.background_list.append(pygame.transform.smoothscale(bg_norm, (WIDTH, HEIGHT)))
@@ -876,7 +1389,7 @@ class Game:
             # Compatible with old season system
             self.background_normal = self.background_list[0] if self.background_list else None
             self.background_winter = None
-            bg_win = load_image("background_winter.png") or load_image("background_snow.png")
+            bg_win = load_image("background_winter.png", alpha=False) or load_image("background_snow.png", alpha=False)
             if bg_win is not None:
                 try:
                     self.background_winter = pygame.transform.smoothscale(bg_win, (WIDTH, HEIGHT))
@@ -884,13 +1397,18 @@ class Game:
                     pass
 
     def load_scenes_config(self):
-        """Load scene configuration file"""
+        """Load scene configuration file (parsed once per process; restarts reuse the cached config)"""
+        global _scenes_config_cache
+        if _scenes_config_cache is not None:
+            self.scenes = _scenes_config_cache
+            return
         try:
             config_path = os.path.join("assets", "scenes.json")
             if os.path.exists(config_path):
                 with open(config_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self.scenes = data.get("scenes", [])
+                    _scenes_config_cache = self.scenes
                     log(f"Successfully loaded {len(self.scenes)} scene configurations")
             else:
                 log("scenes.json config file not found, using default background system")
@@ -909,7 +1427,7 @@ class Game:
         # Load background
         bg_file = scene.get("background")
         if bg_file:
-            bg_img = load_image(bg_file)
+            bg_img = load_image(bg_file, alpha=False)
             if bg_img is not None:
                 try:
                     self.background_normal = pygame.transform.smoothscale(bg_img, (WIDTH, HEIGHT))
@@ -940,6 +1458,7 @@ class Game:
                         height = height // 2
                         y = y - 50  # Move up
                         img = pygame.transform.smoothscale(img, (width, height))
+                    img = make_static_sprite(img)
                     
                     # Create obstacle rect
                     rect = pygame.Rect(x, y, width, height)
@@ -959,45 +1478,44 @@ class Game:
                 rect = pygame.Rect(x, y, width, height)
                 self.obstacles.append(rect)
                 self.obstacle_images.append(None)
+        self._rebuild_obstacle_geometry()
+        self._scene_layers.clear()
+        # Blend composites are keyed by this scene's surfaces: drop them with the scene
+        self._season_blend_cache.clear()
 
     def compute_hide_spot(self, mouse_pos: Tuple[int, int]) -> Tuple[int, int]:
         """Pick nearest obstacle to cat, generate target point on opposite side from mouse [inside obstacle], ensure occlusion."""
         if not self.obstacles:
             return (self.cat.x, max(60 + self.cat.size, self.cat.y))
         cx, cy = self.cat.x, self.cat.y
-        # Find nearest obstacle
-        nearest = min(self.obstacles, key=lambda r: (r.centerx - cx) ** 2 + (r.centery - cy) ** 2)
-        mx, my = mouse_pos
-        dx = nearest.centerx - mx
-        dy = nearest.centery - my
-        # On the far side of the obstacle relative to the mouse, choose a slightly inset point so the center is inside the rect and gets occluded
-        inset_x = max(HIDE_INSET_MIN, min(int(nearest.width * HIDE_INSET_FRACTION), self.cat.size))
-        inset_y = max(HIDE_INSET_MIN, min(int(nearest.height * HIDE_INSET_FRACTION), self.cat.size))
-        if abs(dx) >= abs(dy):
-            # Left/right side hide (interior), allow peeking from left/right, but not from bottom
-            side_sign = 1 if dx >= 0 else -1  # Mouse on left => choose right side
-            tx = nearest.centerx + side_sign * (nearest.width / 2 - inset_x)
-            # y near current value, but force not exceeding obstacle bottom minus cat radius, avoid bottom peek
-            ty = clamp(cy, nearest.top + inset_y, nearest.bottom - inset_y)
-            safe_bottom_y = nearest.bottom - self.cat.size - 1
-            if safe_bottom_y >= nearest.top + inset_y:
-                ty = min(ty, safe_bottom_y)
-            else:
-                # Extreme case: obstacle too short, near top
-                ty = nearest.top + inset_y
-        else:
-            # Vertical: force choose top interior (allow top/corner peek, forbid bottom peek)
-            ty = nearest.top + inset_y
-            tx = clamp(cx, nearest.left + inset_x, nearest.right - inset_x)
-        # Final fallback constraint within screen
-        tx = clamp(tx, 0 + self.cat.size, WIDTH - self.cat.size)
-        ty = clamp(ty, 60 + self.cat.size, HEIGHT - self.cat.size)
-        return (int(tx), int(ty))
+        # Find nearest obstacle via the x-sorted spatial index, reusing the result while the cat stays in its cell
+        key_x, key_y = int(cx) >> HIDE_NEAREST_CELL_SHIFT, int(cy) >> HIDE_NEAREST_CELL_SHIFT
+        cell_x, cell_y, i = self._near_cache
+        if key_x != cell_x or key_y != cell_y:
+            i = self._nearest_obstacle_index(cx, cy)
+            self._near_cache = (key_x, key_y, i)
+        # Geometry comes from the SoA arrays rather than Rect attributes; the cat position is snapped
+        # to ints (same result: the kernel only clamps it between integer bounds before truncating)
+        return hide_spot_xy(self._obs_l[i], self._obs_t[i], self._obs_r[i], self._obs_b[i],
+                            int(cx), int(cy), mouse_pos[0], mouse_pos[1], self.cat.size)
         
     def handle_events(self):
-        for event in pygame.event.get():
+        # Pump once and fetch only the event types handled below, then drop the rest
+        # without pumping again so no input arriving meanwhile is lost
+        events = pygame.event.get(HANDLED_EVENT_TYPES)
+        pygame.event.clear(pump=False)
+        # Latest pointer position first: the dispatch loop below may return early
+        for event in reversed(events):
+            if event.type == pygame.MOUSEMOTION:
+                self._mouse_pos = event.pos
+                break
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Window contents were damaged: present the frozen screen again (full flip for gameplay)
+                self._static_frame = None
+                self._presented_layer = None
             elif event.type == pygame.KEYDOWN:
                 # Start screen: press Enter/Space to start
                 if not self.started:
@@ -1021,6 +1539,7 @@ class Game:
                 # if event.key == pygame.K_t and self.started and not self.paused and not self.game_over:
                 #     self._season_direction = -1 if self.season_mix > 0.5 else 1
                 #     self._season_hold = 0
+                #     self._season_idle = False
                 #     return
                 # Allow item switch when not paused
                 if event.key == pygame.K_SPACE and self.started and not self.paused and not self.game_over:
@@ -1050,8 +1569,11 @@ class Game:
         - If SEASON_AUTO_CYCLE is True, bounces back and forth automatically
           otherwise stops direction at the end until manually toggled (T)
         """
+        # Stopped at an endpoint without auto-cycling: nothing left to animate
+        if self._season_idle:
+            return
         # Do not animate seasons when not started, paused, or after game over
-        if not getattr(self, 'started', False) or getattr(self, 'paused', False) or getattr(self, 'game_over', False):
+        if not self.started or self.paused or self.game_over:
             return
         # Nothing to do if transition would be instantaneous or invalid
         if SEASON_TRANSITION_FRAMES <= 0:
@@ -1063,6 +1585,7 @@ class Game:
         # Progress mix in current direction
         step = 1.0 / float(SEASON_TRANSITION_FRAMES)
         self.season_mix += step * (1 if self._season_direction >= 0 else -1)
+        self._scene_layers.clear()
         # Clamp and handle endpoints
         if self.season_mix >= 1.0:
             self.season_mix = 1.0
@@ -1072,6 +1595,7 @@ class Game:
             else:
                 # Stop at end when not auto-cycling
                 self._season_direction = 0
+                self._season_idle = True
         elif self.season_mix <= 0.0:
             self.season_mix = 0.0
             self._season_hold = SEASON_HOLD_FRAMES
@@ -1080,6 +1604,7 @@ class Game:
             else:
                 # Stop at end when not auto-cycling
                 self._season_direction = 0
+                self._season_idle = True
         
     def _update_map_transition(self):
         """Map switching system: cat auto-leaves screen every 20s, or player presses WASD to switch"""
@@ -1166,11 +1691,17 @@ class Game:
             self.current_background_index = (self.current_background_index + 1) % len(self.background_list)
             self.background_normal = self.background_list[self.current_background_index]
             
-            # Regenerate obstacles (old system)
-            for i, rect in enumerate(self.obstacles):
-                new_x = random.randint(0, WIDTH - rect.width)
-                new_y = random.randint(60 + rect.height // 2, HEIGHT - rect.height // 2)
-                self.obstacles[i] = pygame.Rect(new_x, new_y, rect.width, rect.height)
+            # Regenerate obstacles (old system): x in [0, WIDTH - w], y in [60 + h//2, HEIGHT - h//2]
+            # One random() draw per coordinate in a single comprehension (cheaper than randint per value)
+            rand = random.random
+            self.obstacles[:] = [
+                pygame.Rect(int(rand() * (WIDTH - w + 1)), 60 + h // 2 + int(rand() * (HEIGHT - 60 - 2 * (h // 2) + 1)), w, h)
+                for _, _, w, h in self.obstacles
+            ]
+            self._rebuild_obstacle_geometry()
+            self._scene_layers.clear()
+            # Blend composites are keyed by this scene's surfaces: drop them with the scene
+            self._season_blend_cache.clear()
         
         # Enter from opposite edge
         margin = self.cat.size
@@ -1203,6 +1734,8 @@ class Game:
         self.waiting_for_player = False
         self.cat_leave_direction = None
         self.map_transition_timer = SCENE_SWITCH_INTERVAL  # Reset 20s timer
+        # Scene switch leaves the previous scene's objects behind: collect the young generations now
+        gc.collect(1)
         
         # Don't clear thrown items, let game continue
         # self.player.thrown_items.clear()  # Commented out, keep game state
@@ -1214,15 +1747,16 @@ class Game:
             self._switch_map_instantly()
     
     def check_collision(self, item):
-        # Check if item hit cat
-        dx = item["x"] - self.cat.x
-        dy = item["y"] - self.cat.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        # Check if item hit cat (compare squared distances, no sqrt needed)
+        cat = self.cat
+        dx = item.x - cat.x
+        dy = item.y - cat.y
+        r = cat.size
         
-        if distance < self.cat.size:
+        if dx*dx + dy*dy < r*r:
             # Hit cat - always use cat's current needs to judge
             cat_need = self.cat.get_current_need()
-            if item["type"] == cat_need:
+            if item.type == cat_need:
                 # Only add 1 point when throwing correct item cat needs
                 self.player.score += 1
                 # Can choose not to change money/affinity; here keep affinity increase, need relief
@@ -1230,14 +1764,13 @@ class Game:
                 # Reset consecutive wrong count
                 self.player.consecutive_wrong = 0
 
-                if item["type"] == "food":
+                if item.type == "food":
                     self.cat.hunger = max(0, self.cat.hunger - 15)
                 else:
                     self.cat.playfulness = max(0, self.cat.playfulness - 15)
                 
-                # Hit correct, remove from list
-                if item in self.player.thrown_items:
-                    self.player.thrown_items.remove(item)
+                # Hit correct, remove from list (ThrownItem has no __eq__, so remove() matches by identity)
+                self.player.thrown_items.remove(item)
                 
                 return True, "Correct! +1"
             else:
@@ -1249,150 +1782,358 @@ class Game:
                 return True, "Not this one!"
         return False, ""
 
-    def draw_obstacles(self):
+    def _season_alpha_surface(self, tex: pygame.Surface, alpha: int) -> pygame.Surface:
+        """Copy of tex with a fixed surface alpha; shared textures are never re-alpha'd per frame."""
+        key = (tex, alpha)
+        surf = self._season_blend_cache.get(key)
+        if surf is None:
+            surf = tex.copy()
+            surf.set_alpha(alpha)
+            self._season_blend_cache[key] = surf
+        return surf
+
+    def _season_background(self, bn: pygame.Surface, bw: pygame.Surface, mix: float) -> pygame.Surface:
+        """Opaque background cross-faded normal -> winter at the nearest blend step (composed over WHITE)."""
+        step = round(mix * SEASON_BLEND_STEPS)
+        key = ("background", bn, bw, step)
+        surf = self._season_blend_cache.get(key)
+        if surf is None:
+            q = step / SEASON_BLEND_STEPS
+            alpha_bn = int(255 * (1.0 - q))
+            alpha_bw = int(255 * q)
+            surf = pygame.Surface((WIDTH, HEIGHT)).convert()
+            surf.fill(WHITE)
+            if alpha_bn > 0:
+                surf.blit(self._season_alpha_surface(bn, alpha_bn), (0, 0))
+            if alpha_bw > 0:
+                surf.blit(self._season_alpha_surface(bw, alpha_bw), (0, 0))
+            self._season_blend_cache[key] = surf
+        return surf
+
+    def _draw_background(self, target: pygame.Surface):
+        """Paint WHITE plus the current background, cross-faded normal -> winter by season_mix."""
+        target.fill(WHITE)
+        bn = self.background_normal
+        bw = self.background_winter
+        if bn is not None or bw is not None:
+            mix = clamp(self.season_mix, 0.0, 1.0)
+            if bn is not None and bw is not None and 0.0 < mix < 1.0:
+                # Pre-blended composite for the current blend step (one blit, no alpha toggling)
+                target.blit(self._season_background(bn, bw, mix), (0, 0))
+            else:
+                if mix >= 1.0 and bw is not None:
+                    target.blit(bw, (0, 0))
+                elif bn is not None:
+                    target.blit(bn, (0, 0))
+
+    def _scene_layer(self, with_obstacles: bool) -> pygame.Surface:
+        """Cached full-screen background (optionally with obstacles baked in); cleared when scene or season changes."""
+        layer = self._scene_layers.get(with_obstacles)
+        if layer is None:
+            if with_obstacles:
+                layer = self._scene_layer(False).copy()
+                self.draw_obstacles(layer)
+            else:
+                layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+                self._draw_background(layer)
+            self._scene_layers[with_obstacles] = layer
+        return layer
+
+    def draw_obstacles(self, target: pygame.Surface | None = None, pending: list | None = None):
+        # With a pending list (queued cat/item blits) obstacle sprites join that batch; the caller submits it
+        if target is None:
+            target = screen
+        owns_batch = pending is None
+        if owns_batch:
+            pending = []
         # If using scene system, draw obstacle images directly
-        if self.use_scene_system and hasattr(self, 'obstacle_images'):
-            for i, rect in enumerate(self.obstacles):
+        if self.use_scene_system:
+            # Sprites are queued and submitted in one blits() call
+            # Scene sprites match their rect exactly, so obstacles outside the clip rect can be culled up front
+            for i in target.get_clip().collidelistall(self.obstacles):
+                rect = self.obstacles[i]
                 if i < len(self.obstacle_images) and self.obstacle_images[i] is not None:
-                    screen.blit(self.obstacle_images[i], rect.topleft)
+                    pending.append((self.obstacle_images[i], rect.topleft))
                 else:
-                    # Draw rect when no image
-                    pygame.draw.rect(screen, self.obstacle_color, rect)
+                    # Draw rect when no image (after whatever is queued beneath it)
+                    if pending:
+                        target.blits(pending, 0)
+                        pending.clear()
+                    pygame.draw.rect(target, self.obstacle_color, rect)
+            if owns_batch and pending:
+                target.blits(pending, 0)
             return
-        
         # Old system: draw obstacles with season cross-fade
         mix = clamp(self.season_mix, 0.0, 1.0)
+        if mix <= 0.0 or mix >= 1.0:
+            # Steady state (season pinned at an endpoint): one texture per obstacle, no blend math
+            # Sprite, position and painted bounds are precomputed, so obstacles outside the clip are culled
+            # and the rest join the pending blits() batch (no per-frame entry inspection or Rect reads)
+            use_winter = mix >= 1.0
+            draw_list = self._obs_draw_lists.get(use_winter)
+            if draw_list is None:
+                draw_list = self._obstacle_draw_list(use_winter)
+                self._obs_draw_lists[use_winter] = draw_list
+            bounds, entries = draw_list
+            for i in target.get_clip().collidelistall(bounds):
+                tex, pos = entries[i]
+                if tex is not None:
+                    pending.append((tex, pos))
+                else:
+                    # Rect fallback: draw after whatever is queued beneath it
+                    if pending:
+                        target.blits(pending, 0)
+                        pending.clear()
+                    pygame.draw.rect(target, self.obstacle_color, pos)
+            if owns_batch and pending:
+                target.blits(pending, 0)
+            return
+        # Blended frames: per-obstacle season mix; sprites join the pending batch like the steady state
+        def draw_rect_fallback(rect):
+            # Rect fallback: draw after whatever is queued beneath it
+            if pending:
+                target.blits(pending, 0)
+                pending.clear()
+            pygame.draw.rect(target, self.obstacle_color, rect)
         for i, rect in enumerate(self.obstacles):
             entry = None
-            if hasattr(self, "obstacle_surfs") and i < len(self.obstacle_surfs):
+            if i < len(self.obstacle_surfs):
                 entry = self.obstacle_surfs[i]
             # Compatible with old structure: tuple or surface
             if isinstance(entry, tuple) and len(entry) == 3 and entry[0] is not None:
                 tex, dx, dy = entry
-                screen.blit(tex, (rect.left + dx, rect.top + dy))
+                pending.append((tex, (rect.left + dx, rect.top + dy)))
                 continue
-            if entry is not None and hasattr(entry, 'get_width'):
-                screen.blit(entry, rect.topleft)
+            if isinstance(entry, pygame.Surface):
+                pending.append((entry, rect.topleft))
                 continue
             if not isinstance(entry, dict):
-                pygame.draw.rect(screen, self.obstacle_color, rect)
+                draw_rect_fallback(rect)
                 continue
             base = entry.get("normal")
             win = entry.get("winter")
             if base is None and win is None:
-                pygame.draw.rect(screen, self.obstacle_color, rect)
+                draw_rect_fallback(rect)
                 continue
             if base is not None and win is not None and 0.0 < mix < 1.0:
                 btex, bdx, bdy = base
                 wtex, wdx, wdy = win
-                prev_ba = btex.get_alpha()
-                prev_wa = wtex.get_alpha()
-                alpha_b = int(255 * (1.0 - mix))
-                alpha_w = int(255 * mix)
+                # Quantized blend step; alpha copies are cached instead of toggling set_alpha on shared textures
+                q = round(mix * SEASON_BLEND_STEPS) / SEASON_BLEND_STEPS
+                alpha_b = int(255 * (1.0 - q))
+                alpha_w = int(255 * q)
                 if alpha_b > 0:
-                    btex.set_alpha(alpha_b)
-                    screen.blit(btex, (rect.left + bdx, rect.top + bdy))
+                    pending.append((self._season_alpha_surface(btex, alpha_b), (rect.left + bdx, rect.top + bdy)))
                 if alpha_w > 0:
-                    wtex.set_alpha(alpha_w)
-                    screen.blit(wtex, (rect.left + wdx, rect.top + wdy))
-                btex.set_alpha(prev_ba)
-                wtex.set_alpha(prev_wa)
+                    pending.append((self._season_alpha_surface(wtex, alpha_w), (rect.left + wdx, rect.top + wdy)))
             else:
                 if mix >= 1.0 and win is not None:
                     wtex, wdx, wdy = win
-                    screen.blit(wtex, (rect.left + wdx, rect.top + wdy))
+                    pending.append((wtex, (rect.left + wdx, rect.top + wdy)))
                 elif base is not None:
                     btex, bdx, bdy = base
-                    screen.blit(btex, (rect.left + bdx, rect.top + bdy))
+                    pending.append((btex, (rect.left + bdx, rect.top + bdy)))
                 else:
-                    pygame.draw.rect(screen, self.obstacle_color, rect)
-
-    def draw_speech_bubble(self):
-        # Draw rounded bubble with triangle tail near cat, showing current needs
-        text = self.need_text
-        if not text:
-            return
+                    draw_rect_fallback(rect)
+        if owns_batch and pending:
+            target.blits(pending, 0)
+
+    def _obstacle_draw_list(self, use_winter: bool) -> Tuple[list, list]:
+        """Old-system obstacle sprites for one season endpoint: painted bounds per obstacle, and
+        (texture, position) entries; texture None means the obstacle is drawn as a plain rect (position = rect)."""
+        surfs = self.obstacle_surfs
+        bounds, entries = [], []
+        for i, rect in enumerate(self.obstacles):
+            entry = surfs[i] if i < len(surfs) else None
+            if isinstance(entry, dict):
+                sprite = (use_winter and entry.get("winter")) or entry.get("normal")
+            elif isinstance(entry, tuple) and len(entry) == 3 and entry[0] is not None:
+                sprite = entry
+            elif isinstance(entry, pygame.Surface):
+                sprite = (entry, 0, 0)
+            else:
+                sprite = None
+            if sprite is None:
+                bounds.append(rect)
+                entries.append((None, rect))
+            else:
+                tex, dx, dy = sprite
+                pos = (rect.left + dx, rect.top + dy)
+                bounds.append(tex.get_rect(topleft=pos))
+                entries.append((tex, pos))
+        return bounds, entries
+
+    def _compose_bubble_body(self, text: str) -> pygame.Surface:
+        """Pre-render the bubble body for text: white rounded rect, black outline, padded text."""
         pad = 8
         surf = self.font.render(text, True, BLACK)
         bw, bh = surf.get_width() + pad * 2, surf.get_height() + pad * 2
+        body = pygame.Surface((bw, bh), pygame.SRCALPHA)
+        pygame.draw.rect(body, WHITE, body.get_rect(), border_radius=8)
+        pygame.draw.rect(body, BLACK, body.get_rect(), width=2, border_radius=8)
+        body.blit(surf, (pad, pad))
+        return body
+
+    def _bubble_tail(self, side: str) -> Tuple[pygame.Surface, int, int]:
+        """Tail sprite for a bubble edge plus its (dx, dy) offset from the tail's base center point."""
+        entry = self._bubble_tails.get(side)
+        if entry is None:
+            tail_len = BUBBLE_TAIL_LEN
+            half_w = BUBBLE_TAIL_W // 2
+            # Triangle relative to the base center: (base_left, base_right, tip)
+            if side == 'top':
+                pts = [(-half_w, 0), (half_w, 0), (0, -tail_len)]
+            elif side == 'bottom':
+                pts = [(-half_w, 0), (half_w, 0), (0, tail_len)]
+            elif side == 'left':
+                pts = [(0, -half_w), (0, half_w), (-tail_len, 0)]
+            else:  # right
+                pts = [(0, -half_w), (0, half_w), (tail_len, 0)]
+            pad = 2  # Room for the 2px outline
+            ox = min(x for x, _ in pts) - pad
+            oy = min(y for _, y in pts) - pad
+            w = max(x for x, _ in pts) - ox + pad + 1
+            h = max(y for _, y in pts) - oy + pad + 1
+            surf = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+            base_left, base_right, tip = [(x - ox, y - oy) for x, y in pts]
+            pygame.draw.polygon(surf, WHITE, [base_left, base_right, tip])
+            pygame.draw.lines(surf, BLACK, False, [base_left, tip, base_right], 2)
+            entry = (surf, ox, oy)
+            self._bubble_tails[side] = entry
+        return entry
+
+    def draw_speech_bubble(self) -> pygame.Rect | None:
+        # Draw rounded bubble with triangle tail near cat, showing current needs; returns the screen rect painted
+        text = self.need_text
+        # No speech while the cat waits in its hiding spot: skips the layout work and doesn't give the spot away
+        if not text or self.hide_waiting:
+            return None
+        # Bubble body (rounded rect + outline + text) is composed once per text; only the tail is drawn per frame
+        body = self._bubble_cache.get(text)
+        if body is None:
+            body = self._compose_bubble_body(text)
+            self._bubble_cache[text] = body
+        bw, bh = body.get_width(), body.get_height()
     # Compute desired position (with sticky side and smooth animation); prefer top, else fall back to right/left/bottom if invalid
         margin = 8
+        # Local bindings for the per-candidate helpers below (called up to 4x per frame)
+        Rect = pygame.Rect
+        hypot = math.hypot
+        cat_x, cat_y, cat_size = self.cat.x, self.cat.y, self.cat.size
+        cx, cy = int(cat_x), int(cat_y)
+        max_bx, max_by = WIDTH - bw - 5, HEIGHT - bh - 5
         def calc_rect(side: str):
             if side == 'top':
-                bx0 = int(self.cat.x - bw / 2)
-                by0 = int(self.cat.y - self.cat.size - bh - 10)
+                bx0 = int(cat_x - bw / 2)
+                by0 = int(cat_y - cat_size - bh - 10)
             elif side == 'bottom':
-                bx0 = int(self.cat.x - bw / 2)
-                by0 = int(self.cat.y + self.cat.size + 10)
+                bx0 = int(cat_x - bw / 2)
+                by0 = int(cat_y + cat_size + 10)
             elif side == 'left':
-                bx0 = int(self.cat.x - self.cat.size - bw - 12)
-                by0 = int(self.cat.y - bh / 2)
+                bx0 = int(cat_x - cat_size - bw - 12)
+                by0 = int(cat_y - bh / 2)
             else:  # right
-                bx0 = int(self.cat.x + self.cat.size + 12)
-                by0 = int(self.cat.y - bh / 2)
-            bx0 = int(clamp(bx0, 5, WIDTH - bw - 5))
-            by0 = int(clamp(by0, 65, HEIGHT - bh - 5))
-            return pygame.Rect(bx0, by0, bw, bh)
+                bx0 = int(cat_x + cat_size + 12)
+                by0 = int(cat_y - bh / 2)
+            # clamp inlined (up to 4 candidates per frame); bx0/by0 are already ints
+            bx0 = max_bx if bx0 > max_bx else bx0
+            bx0 = 5 if bx0 < 5 else bx0
+            by0 = max_by if by0 > max_by else by0
+            by0 = 65 if by0 < 65 else by0
+            return Rect(bx0, by0, bw, bh)
 
         def valid(rect: pygame.Rect):
             return rect.left >= 5 and rect.right <= WIDTH - 5 and rect.top >= 65 and rect.bottom <= HEIGHT - 5
 
         # Avoid bubble covering cat: prefer bubble rect not intersecting cat
+        # Cat hitbox is built once per frame, slightly expanded as a safety margin
+        cr = int(cat_size)
+        cat_rect = Rect(cx - cr, cy - cr, cr * 2, cr * 2)
+        cat_rect.inflate_ip(8, 8)
         def overlaps_cat(rect: pygame.Rect) -> bool:
-            cx, cy, r = int(self.cat.x), int(self.cat.y), int(self.cat.size)
-            cat_rect = pygame.Rect(cx - r, cy - r, r * 2, r * 2)
-            # Slightly expand cat hitbox, add safety margin
-            cat_rect.inflate_ip(8, 8)
             return rect.colliderect(cat_rect)
 
-        # Fallback directions: include current direction to enhance stickiness
-        candidates = ['top', 'right', 'left', 'bottom']
-        if self.bubble_side in candidates:
-            # Ensure current direction first in list, enhance stability
-            candidates.remove(self.bubble_side)
-            candidates.insert(0, self.bubble_side)
-
-    # Choose by composite score: validity + not occluded + closest to mouse + sticky preference
-        mx, my = pygame.mouse.get_pos()
-    # Enable 'near player side' bias only when the mouse is close to the cat
-        mc_dist = math.hypot(self.cat.x - mx, self.cat.y - my)
-        apply_mouse_bias = mc_dist <= BUBBLE_MOUSE_BIAS_DISTANCE
-        best = None  # (score, side, rect)
-        for s in candidates:
-            r = calc_rect(s)
-            if not valid(r):
-                continue
-            # Basic distance score: closer to mouse = smaller; only consider when close
-            d = math.hypot((r.centerx - mx), (r.centery - my)) if apply_mouse_bias else 0.0
-            # No occlusion priority: add large penalty if occluding
-            overlap_penalty = 10000 if overlaps_cat(r) else 0
-            # Sticky preference: current direction gets score reduction, avoid frequent switching
-            sticky_bonus = -BUBBLE_STICKY_BIAS_PX if s == self.bubble_side else 0
-            score = d + overlap_penalty + sticky_bonus
-            if best is None or score < best[0]:
-                best = (score, s, r)
-        if best is None:
-            # Fallback: choose any visible area
-            chosen_side, chosen_rect = 'top', calc_rect('top')
+        mx, my = self._mouse_pos
+        # Side selection is invariant across most frames: redo it only when the cat or the mouse has moved
+        # more than BUBBLE_RELAYOUT_DISTANCE since the last selection (or the text changed); otherwise the
+        # current side is kept and only its rect is recomputed for the cat's current position
+        last = self._bubble_layout
+        if last is not None and last[4] == text:
+            lcx, lcy = cat_x - last[0], cat_y - last[1]
+            lmx, lmy = mx - last[2], my - last[3]
+            relayout = (lcx * lcx + lcy * lcy > BUBBLE_RELAYOUT_DISTANCE_SQ
+                        or lmx * lmx + lmy * lmy > BUBBLE_RELAYOUT_DISTANCE_SQ)
         else:
-            _, chosen_side, chosen_rect = best
+            relayout = True
+        if not relayout:
+            chosen_side = self.bubble_side
+            chosen_rect = calc_rect(chosen_side)
+        else:
+            self._bubble_layout = (cat_x, cat_y, mx, my, text)
+            # Fallback directions: include current direction to enhance stickiness
+            candidates = ['top', 'right', 'left', 'bottom']
+            if self.bubble_side in candidates:
+                # Ensure current direction first in list, enhance stability
+                candidates.remove(self.bubble_side)
+                candidates.insert(0, self.bubble_side)
+
+            # Choose by composite score: validity + not occluded + closest to mouse + sticky preference
+            # Enable 'near player side' bias only when the mouse is close to the cat
+            mcx, mcy = cat_x - mx, cat_y - my
+            apply_mouse_bias = mcx * mcx + mcy * mcy <= BUBBLE_MOUSE_BIAS_DISTANCE_SQ
+            best = None  # (score, side, rect)
+            if not apply_mouse_bias and self.bubble_side in candidates:
+                # Without the mouse bias every distance term is 0, so a valid, unoccluded current side
+                # scores -BUBBLE_STICKY_BIAS_PX and beats every other candidate: skip the scoring loop
+                r = calc_rect(self.bubble_side)
+                if valid(r) and not overlaps_cat(r):
+                    best = (-BUBBLE_STICKY_BIAS_PX, self.bubble_side, r)
+                    candidates = ()
+            for s in candidates:
+                r = calc_rect(s)
+                if not valid(r):
+                    continue
+                # Basic distance score: closer to mouse = smaller; only consider when close
+                # (kept linear: BUBBLE_STICKY_BIAS_PX is an additive pixel bias on this distance)
+                d = hypot((r.centerx - mx), (r.centery - my)) if apply_mouse_bias else 0.0
+                # No occlusion priority: add large penalty if occluding
+                overlap_penalty = 10000 if overlaps_cat(r) else 0
+                # Sticky preference: current direction gets score reduction, avoid frequent switching
+                sticky_bonus = -BUBBLE_STICKY_BIAS_PX if s == self.bubble_side else 0
+                score = d + overlap_penalty + sticky_bonus
+                if best is None or score < best[0]:
+                    best = (score, s, r)
+            if best is None:
+                # Fallback: choose any visible area
+                chosen_side, chosen_rect = 'top', calc_rect('top')
+            else:
+                _, chosen_side, chosen_rect = best
 
         # Smooth bubble position movement, reduce jitter
         bx_des, by_des = chosen_rect.left, chosen_rect.top
-        if self._bubble_pos is None:
-            self._bubble_pos = [float(bx_des), float(by_des)]
+        # Integer EMA on Q8 fixed point: positions are pixels * 256, so rounding back is an add and a shift
+        tx, ty = bx_des << 8, by_des << 8
+        pos = self._bubble_pos
+        if pos is None:
+            self._bubble_pos = [tx, ty]
+            bx, by = bx_des, by_des
         else:
-            alpha = BUBBLE_SMOOTH_ALPHA
-            self._bubble_pos[0] += (bx_des - self._bubble_pos[0]) * alpha
-            self._bubble_pos[1] += (by_des - self._bubble_pos[1]) * alpha
-        bx = int(round(self._bubble_pos[0]))
-        by = int(round(self._bubble_pos[1]))
+            px, py = pos
+            ex, ey = tx - px, ty - py
+            if -128 < ex < 128 and -128 < ey < 128:
+                # Converged (within half a pixel, would round to the target anyway): snap and skip the blend
+                pos[0], pos[1] = tx, ty
+                bx, by = bx_des, by_des
+            else:
+                num, den = BUBBLE_SMOOTH_ALPHA
+                px += ex * num // den
+                py += ey * num // den
+                pos[0], pos[1] = px, py
+                bx = (px + 128) >> 8
+                by = (py + 128) >> 8
         bubble_rect = pygame.Rect(bx, by, bw, bh)
         self.bubble_side = chosen_side
         # Calculate triangle tail, avoid excessive deformation: fixed length/width, draw tail below bubble to avoid covering text
-        tail_len = BUBBLE_TAIL_LEN
-        tail_w = BUBBLE_TAIL_W
-        cx, cy = int(self.cat.x), int(self.cat.y)
         # Choose bubble edge closest to cat as tail exit
         dx = cx - bubble_rect.centerx
         dy = cy - bubble_rect.centery
@@ -1403,46 +2144,24 @@ class Game:
             # Top/bottom edge
             side = 'bottom' if dy > 0 else 'top'
 
-        if side == 'top':
-            base_cx = int(clamp(cx, bubble_rect.left + 10, bubble_rect.right - 10))
-            base_cy = bubble_rect.top
-            base_left = (base_cx - tail_w // 2, base_cy)
-            base_right = (base_cx + tail_w // 2, base_cy)
-            tip = (base_cx, base_cy - tail_len)
-        elif side == 'bottom':
+        if side == 'top' or side == 'bottom':
             base_cx = int(clamp(cx, bubble_rect.left + 10, bubble_rect.right - 10))
-            base_cy = bubble_rect.bottom
-            base_left = (base_cx - tail_w // 2, base_cy)
-            base_right = (base_cx + tail_w // 2, base_cy)
-            tip = (base_cx, base_cy + tail_len)
-        elif side == 'left':
-            base_cx = bubble_rect.left
-            base_cy = int(clamp(cy, bubble_rect.top + 10, bubble_rect.bottom - 10))
-            base_left = (base_cx, base_cy - tail_w // 2)
-            base_right = (base_cx, base_cy + tail_w // 2)
-            tip = (base_cx - tail_len, base_cy)
-        else:  # right
-            base_cx = bubble_rect.right
+            base_cy = bubble_rect.top if side == 'top' else bubble_rect.bottom
+        else:
+            base_cx = bubble_rect.left if side == 'left' else bubble_rect.right
             base_cy = int(clamp(cy, bubble_rect.top + 10, bubble_rect.bottom - 10))
-            base_left = (base_cx, base_cy - tail_w // 2)
-            base_right = (base_cx, base_cy + tail_w // 2)
-            tip = (base_cx + tail_len, base_cy)
 
         # Draw tail (triangle) first, then rounded rect, so tail and text don't overlap
-        pygame.draw.polygon(screen, WHITE, [base_left, base_right, tip])
-        pygame.draw.lines(screen, BLACK, False, [base_left, tip, base_right], 2)
-
-        # Draw rounded rect (above tail)
-        pygame.draw.rect(screen, WHITE, bubble_rect, border_radius=8)
-        pygame.draw.rect(screen, BLACK, bubble_rect, width=2, border_radius=8)
-
-        # Draw text (last)
-        screen.blit(surf, (bx + pad, by + pad))
+        # The tail shape is fixed per side: blit its pre-rendered sprite at the base point, then the
+        # rounded rect with text (above tail); both go out in one blits() call
+        tail, ox, oy = self._bubble_tail(side)
+        tail_rect, body_rect = screen.blits(((tail, (base_cx + ox, base_cy + oy)), (body, (bx, by))))
+        return body_rect.union(tail_rect)
     
-    def draw_direction_arrows(self):
-        """Draw pixel-style direction arrow UI hints - only show direction cat left"""
+    def draw_direction_arrows(self) -> pygame.Rect | None:
+        """Draw pixel-style direction arrow UI hints - only show direction cat left; returns the screen rect painted"""
         if not self.waiting_for_player or not self.cat_leave_direction:
-            return
+            return None
         
         # Update pulse animation
         self.arrow_pulse += self.arrow_pulse_direction * 2
@@ -1466,7 +2185,7 @@ class Game:
         }
         
         if self.cat_leave_direction not in arrow_config:
-            return
+            return None
         
         x, y, direction = arrow_config[self.cat_leave_direction]
         
@@ -1513,11 +2232,12 @@ class Game:
         
         # Draw to screen
         rect = arrow_surf.get_rect(center=(x, y))
-        screen.blit(arrow_surf, rect)
+        return screen.blit(arrow_surf, rect)
         
-    def draw_targeting(self):
-        """Draw pixel-style targeting effect"""
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+    def draw_targeting(self) -> pygame.Rect:
+        """Draw pixel-style targeting effect; returns a screen rect covering everything it may paint"""
+        mouse_x, mouse_y = self._mouse_pos
+        draw_rect = pygame.draw.rect  # Bound once: up to ~20 block draws per frame
         
         # Calculate cat collision rect
         cat_left = self.cat.x - self.cat.size
@@ -1540,27 +2260,29 @@ class Game:
             crosshair_color = (255, 255, 255)  # White
             gap = 6
             arm_length = 10
+        reach = gap + arm_length + pixel_size
+        painted = pygame.Rect(mouse_x - reach, mouse_y - reach, 2 * reach + 1, 2 * reach + 1)
         
         # Draw crosshair four directions (with pixel blocks)
         # Up
         for i in range(gap, gap + arm_length, pixel_size):
-            pygame.draw.rect(screen, crosshair_color, 
+            draw_rect(screen, crosshair_color, 
                            (mouse_x - pixel_size//2, mouse_y - i, pixel_size, pixel_size))
         # Down
         for i in range(gap, gap + arm_length, pixel_size):
-            pygame.draw.rect(screen, crosshair_color, 
+            draw_rect(screen, crosshair_color, 
                            (mouse_x - pixel_size//2, mouse_y + i, pixel_size, pixel_size))
         # Left
         for i in range(gap, gap + arm_length, pixel_size):
-            pygame.draw.rect(screen, crosshair_color, 
+            draw_rect(screen, crosshair_color, 
                            (mouse_x - i, mouse_y - pixel_size//2, pixel_size, pixel_size))
         # Right
         for i in range(gap, gap + arm_length, pixel_size):
-            pygame.draw.rect(screen, crosshair_color, 
+            draw_rect(screen, crosshair_color, 
                            (mouse_x + i, mouse_y - pixel_size//2, pixel_size, pixel_size))
         
         # Center point
-        pygame.draw.rect(screen, crosshair_color, 
+        draw_rect(screen, crosshair_color, 
                         (mouse_x - pixel_size//2, mouse_y - pixel_size//2, pixel_size, pixel_size))
         
         # If hovering over cat, draw pixel art blinking blocks
@@ -1582,11 +2304,54 @@ class Game:
                 ]
                 
                 for cx, cy in corners:
-                    pygame.draw.rect(screen, (255, 255, 0), (cx, cy, corner_size, corner_size))
+                    draw_rect(screen, (255, 255, 0), (cx, cy, corner_size, corner_size))
+                painted.union_ip(pygame.Rect(corners[0][0], corners[0][1], 2 * offset, 2 * offset))
+        return painted
     
-    def draw_ui(self):
-        # Draw toolbar background
-        pygame.draw.rect(screen, (200, 200, 200), (0, 0, WIDTH, 60))
+    def _ctext(self, text: str, color=BLACK, font: pygame.font.Font | None = None) -> pygame.Surface:
+        """Render text (body font unless another font is given), reusing the surface while the string is unchanged."""
+        if font is None:
+            font = self.font
+        key = (text, color, font)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_MAX_ENTRIES:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
+
+    def _ui_text(self, key: str, text: str, color=BLACK) -> pygame.Surface:
+        """Render a toolbar field, re-rendering only when that field's text or color changed."""
+        prev = self._ui_surfs.get(key)
+        if prev is not None and prev[0] == text and prev[1] == color:
+            return prev[2]
+        surf = self.font.render(text, True, color)
+        self._ui_surfs[key] = (text, color, surf)
+        return surf
+
+    def draw_ui(self) -> pygame.Rect | None:
+        # The toolbar only changes when one of its displayed values does: compose it once per change, blit per frame
+        # Returns the toolbar rect on frames where it changed, else None
+        player, cat = self.player, self.cat
+        key = (player.selected_item, cat.growth_stage, max(0, int(self.time_left // FPS)),
+               player.score, player.consecutive_wrong, int(cat.affinity))
+        changed = key != self._toolbar_key
+        if changed:
+            self._toolbar_surf = self._compose_toolbar(*key)
+            self._toolbar_key = key
+        rect = screen.blit(self._toolbar_surf, (0, 0))
+        return rect if changed else None
+
+    def _compose_toolbar(self, selected_item: str, stage: int, secs: int, score: int, wrong: int, affinity: int) -> pygame.Surface:
+        """Render the 60px toolbar (labels over the gray bar) for the given displayed values.
+        Labels come from per-field slots, so the countdown re-renders only its own text and the
+        once-a-second timer strings don't churn the shared _ctext LRU."""
+        # Toolbar background
+        surf = pygame.Surface((WIDTH, 60)).convert()
+        surf.fill((200, 200, 200))
 
         # Two-row layout, avoid overlap
         gap = 12
@@ -1596,339 +2361,412 @@ class Game:
         row2_y = 32
 
         # Row1-Left: Selected
-        selected_text = f"Selected: {'Food' if self.player.selected_item == 'food' else 'Toy'}"
-        sel_surf = self.font.render(selected_text, True, BLACK)
-        screen.blit(sel_surf, (left_x, row1_y))
+        selected_text = f"Selected: {'Food' if selected_item == 'food' else 'Toy'}"
+        sel_surf = self._ui_text('selected', selected_text)
+        surf.blit(sel_surf, (left_x, row1_y))
 
         # Row1-Right: Stage
-        stage_text = f"Stage: {self.cat.growth_stage}"
-        stage_surf = self.font.render(stage_text, True, BLACK)
-        screen.blit(stage_surf, (right_x - stage_surf.get_width(), row1_y))
+        stage_text = f"Stage: {stage}"
+        stage_surf = self._ui_text('stage', stage_text)
+        surf.blit(stage_surf, (right_x - stage_surf.get_width(), row1_y))
 
         # Row1-Center: Timer (centered)
-        if hasattr(self, 'time_left'):
-            secs = max(0, int(self.time_left // FPS))
-            timer_text = f"Time Left: {secs:02d}s"
-            timer_surf = self.font.render(timer_text, True, BLACK)
-            screen.blit(timer_surf, (WIDTH//2 - timer_surf.get_width()//2, row1_y))
+        timer_text = f"Time Left: {secs:02d}s"
+        timer_surf = self._ui_text('timer', timer_text)
+        surf.blit(timer_surf, (WIDTH//2 - timer_surf.get_width()//2, row1_y))
 
         # Row2-Left: Score + Wrong
-        score_text = f"Score: {self.player.score}"
-        score_surf = self.font.render(score_text, True, BLACK)
-        screen.blit(score_surf, (left_x, row2_y))
+        score_text = f"Score: {score}"
+        score_surf = self._ui_text('score', score_text)
+        surf.blit(score_surf, (left_x, row2_y))
 
-        wrong = self.player.consecutive_wrong if hasattr(self.player, 'consecutive_wrong') else 0
         wrong_color = RED if wrong > 3 else BLACK
         wrong_text = f"Wrong: {wrong}"
-        wrong_surf = self.font.render(wrong_text, True, wrong_color)
-        screen.blit(wrong_surf, (left_x + score_surf.get_width() + gap, row2_y))
+        wrong_surf = self._ui_text('wrong', wrong_text, wrong_color)
+        surf.blit(wrong_surf, (left_x + score_surf.get_width() + gap, row2_y))
 
         # Row2-Right: Affinity
-        affinity_text = f"Affinity: {int(self.cat.affinity)}%"
-        affinity_surf = self.font.render(affinity_text, True, BLACK)
-        screen.blit(affinity_surf, (right_x - affinity_surf.get_width(), row2_y))
+        affinity_text = f"Affinity: {affinity}%"
+        affinity_surf = self._ui_text('affinity', affinity_text)
+        surf.blit(affinity_surf, (right_x - affinity_surf.get_width(), row2_y))
 
         # Needs hint (red text) removed per user request, no longer displayed
+        return surf
+
+    def _draw_scene(self) -> pygame.Rect | None:
+        """Draw the scene with the cat and thrown items: baked obstacle layer plus the dirty sprite region.
+        Returns that region (None when neither cat nor items are on screen)."""
+        # Background from the cached scene layer, with the static obstacles already baked in
+        screen.blit(self._scene_layer(True), (0, 0))
+        # Draw game elements (don't draw cat when waiting for player)
+        # Only the region under the cat/items is dirty: restore the bare background there,
+        # draw the sprites, then redraw obstacles clipped to it (obstacles still occlude cat and items)
+        dirty = self.player.items_bounds()
+        if not self.waiting_for_player:
+            cat_rect = self.cat.bounds()
+            dirty = cat_rect if dirty is None else dirty.union(cat_rect)
+        if dirty is not None:
+            # Everything inside the dirty rect goes out as one clipped blits() batch: bare background,
+            # cat, items, then obstacles (fallback shape drawing submits the batch first to keep order)
+            screen.set_clip(dirty)
+            pending = [(self._scene_layer(False), dirty, dirty)]
+            if not self.waiting_for_player:
+                self.cat.draw(pending)
+            self.player.draw_items(pending)
+            self.draw_obstacles(pending=pending)
+            if pending:
+                screen.blits(pending, 0)
+            screen.set_clip(None)
+        return dirty
+
+    def _render_frame(self, message: str) -> list | None:
+        """Draw one gameplay frame: scene layer, dirty sprite region, bubble, UI and overlays (no flip).
+        Returns the screen rects to push to the display, or None when the whole screen must be presented."""
+        layer = self._scene_layer(True)
+        # Rects painted over the static scene layer this frame (toolbar only when its values changed)
+        drawn = [self._draw_scene()]
+        # Draw the speech bubble above obstacles to keep it visible
+        drawn.append(self.draw_speech_bubble())
+        drawn.append(self.draw_ui())
+        # Direction arrow hint (show when waiting for player)
+        drawn.append(self.draw_direction_arrows())
+        # Targeting effect (don't show during waiting for player state)
+        if not self.waiting_for_player:
+            drawn.append(self.draw_targeting())
         
+        # Show messages
+        if message:
+            msg_surface = self._ctext(message, BLUE)
+            drawn.append(screen.blit(msg_surface, (WIDTH // 2 - msg_surface.get_width() // 2, 70)))
+        drawn = [r for r in drawn if r is not None]
+        # Everything else on screen is the unchanged layer (and toolbar): on the same layer as the last
+        # presented frame only this frame's rects and the last frame's (now erased) rects differ
+        # (a large total goes out as one flip: many rect copies stop paying off past a fraction of the screen)
+        if layer is self._presented_layer:
+            update = drawn + self._presented_rects
+            area = 0
+            for r in update:
+                area += r.w * r.h
+            if area > DIRTY_UPDATE_MAX_AREA:
+                update = None
+        else:
+            update = None
+        self._presented_layer = layer
+        self._presented_rects = drawn
+        return update
+
     def run(self):
         log("Game loop entering...")
-        ticks = 0
-        while self.running:
-            # Update season transition (if needed)
-            self._update_season()
-            # Update map switching
-            self._update_map_transition()
+        heartbeat_countdown = FPS  # Frames until the next heartbeat log line
+        # Per-frame callables bound once (LOAD_FAST instead of global + attribute lookups)
+        flip = pygame.display.flip
+        update_display = pygame.display.update
+        # Animated frames pace with tick_busy_loop (SDL_Delay alone can overshoot by a scheduler quantum,
+        # giving uneven 60 Hz); frozen screens keep the sleeping tick so they don't spin a core
+        clock_tick = clock.tick_busy_loop
+        idle_tick = clock.tick
+        hypot, sqrt, ceil = math.hypot, math.sqrt, math.ceil
+        randint, rand = random.randint, random.random
+        # Automatic cyclic GC is off during the loop (its collections show up as frame spikes);
+        # startup objects are frozen out of the scanned generations and collections run at natural breaks
+        gc.freeze()
+        gc.disable()
+        # Gameplay pacing: each step is due frame_s after the previous one; a step that finishes more than
+        # a frame late skips drawing (bounded) so the simulation keeps real time on slow machines
+        frame_s = 1.0 / FPS
+        frame_due = perf_counter()
+        render_skips = 0
+        try:
+            while self.running:
+                frame_start = perf_counter()
+                # Update season transition (if needed)
+                self._update_season()
+                # Update map switching
+                self._update_map_transition()
             
-            # Clear screen
-            screen.fill(WHITE)
+                # Handle events
+                self.handle_events()
             
-            # Background: support season transition (normal -> winter)
-            if hasattr(self, "background_normal") or hasattr(self, "background_winter"):
-                mix = clamp(self.season_mix, 0.0, 1.0)
-                bn = getattr(self, 'background_normal', None)
-                bw = getattr(self, 'background_winter', None)
-                if bn is not None and bw is not None and 0.0 < mix < 1.0:
-                    prev_bn_alpha = bn.get_alpha()
-                    prev_bw_alpha = bw.get_alpha()
-                    alpha_bn = int(255 * (1.0 - mix))
-                    alpha_bw = int(255 * mix)
-                    if alpha_bn > 0:
-                        bn.set_alpha(alpha_bn)
-                        screen.blit(bn, (0, 0))
-                    if alpha_bw > 0:
-                        bw.set_alpha(alpha_bw)
-                        screen.blit(bw, (0, 0))
-                    bn.set_alpha(prev_bn_alpha)
-                    bw.set_alpha(prev_bw_alpha)
+                # Start, game-over and paused screens only change through events: present them once, then just
+                # poll events at STATIC_SCREEN_FPS (no redraw, no flip) until the state changes or the window is exposed
+                if not self.started:
+                    static_frame = 'start'
+                elif self.game_over:
+                    static_frame = 'over'
                 else:
-                    if mix >= 1.0 and bw is not None:
-                        screen.blit(bw, (0, 0))
-                    elif bn is not None:
-                        screen.blit(bn, (0, 0))
+                    static_frame = 'paused' if self.paused else None
+                if static_frame is not None and static_frame == self._static_frame:
+                    idle_tick(STATIC_SCREEN_FPS)
+                    continue
+                if static_frame is not None:
+                    # Entering a frozen screen: nothing is animating, so a full collection goes unnoticed
+                    gc.collect()
+                self._static_frame = static_frame
+                if not self.started or self.game_over or self.paused:
+                    # Full-screen states: the next gameplay frame presents the whole screen again
+                    self._presented_layer = None
             
-            # Handle events
-            self.handle_events()
+                # Background for start/game-over screens (gameplay and pause draw their own layer)
+                if not self.started or self.game_over:
+                    screen.blit(self._scene_layer(False), (0, 0))
             
-            # Start screen: show start prompt, don't update game state before start
-            if not self.started:
-                # Semi-transparent overlay and title
-                overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 140))
-                screen.blit(overlay, (0, 0))
-                title = "FEED YOUR CAT"
-                sub = "Press Enter or Click to Start"
-                # Control instructions one operation per line, centered row by row
-                ctrl_lines = [
-                    "Left Click = Throw",
-                    "Space = Switch Item",
-                    "Z = Pause/Resume"
-                ]
-                t_surf = self.large_font.render(title, True, WHITE)
-                s_surf = self.font.render(sub, True, WHITE)
-                ctrl_surfs = [self.font.render(line, True, WHITE) for line in ctrl_lines]
-                # Vertically centered layout within safe area, avoid edge occlusion
-                safe_top = 70
-                safe_bottom = HEIGHT - 20
-                spacing = 12
-                block_h = (
-                    t_surf.get_height()
-                    + spacing + s_surf.get_height()
-                    + spacing * len(ctrl_surfs) + sum(cs.get_height() for cs in ctrl_surfs)
-                )
-                y = max(safe_top, min((HEIGHT - block_h) // 2, safe_bottom - block_h))
-                cx = WIDTH // 2
-                # Title
-                screen.blit(t_surf, (cx - t_surf.get_width() // 2, y))
-                y += t_surf.get_height() + spacing
-                # Subtitle
-                screen.blit(s_surf, (cx - s_surf.get_width() // 2, y))
-                y += s_surf.get_height() + spacing
-                # Control instructions (one operation per line)
-                for cs in ctrl_surfs:
-                    screen.blit(cs, (cx - cs.get_width() // 2, y))
-                    y += cs.get_height() + spacing
-                pygame.display.flip()
-                clock.tick(FPS)
-                continue
-            # Game over state: only show result panel and UI, wait for R/ESC
-            if self.game_over:
-                # Background can still draw basic elements, for simplicity draw UI and end panel
-                self.draw_ui()
-                # Semi-transparent overlay
-                overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 120))
-                screen.blit(overlay, (0, 0))
-                # Text
-                title = "Victory!" if self.game_result == 'win' else ("Defeat" if self.game_result == 'lose' else "Time's Up")
-                t_surf = self.large_font.render(title, True, WHITE)
-                msg_surf = self.font.render(self.end_message, True, WHITE)
-                hint_surf = self.font.render("Press R to restart / Esc to exit", True, WHITE)
-                cx = WIDTH//2
-                screen.blit(t_surf, (cx - t_surf.get_width()//2, HEIGHT//2 - 70))
-                screen.blit(msg_surf, (cx - msg_surf.get_width()//2, HEIGHT//2 - 20))
-                screen.blit(hint_surf, (cx - hint_surf.get_width()//2, HEIGHT//2 + 30))
-                pygame.display.flip()
-                clock.tick(FPS)
-                continue
-            # Paused state: show current screen + pause prompt, don't update state/timer
-            if self.paused:
-                # Draw current scene
-                self.cat.draw()
-                self.player.draw_items()
-                self.draw_obstacles()
-                self.draw_speech_bubble()
-                self.draw_ui()
-                # Overlay pause prompt
-                overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 100))
-                screen.blit(overlay, (0, 0))
-                p_surf = self.large_font.render("Paused", True, WHITE)
-                hint_surf = self.font.render("Press Z to resume", True, WHITE)
-                cx = WIDTH//2
-                screen.blit(p_surf, (cx - p_surf.get_width()//2, HEIGHT//2 - 20))
-                screen.blit(hint_surf, (cx - hint_surf.get_width()//2, HEIGHT//2 + 24))
-                pygame.display.flip()
-                clock.tick(FPS)
-                continue
+                # Start screen: show start prompt, don't update game state before start
+                if not self.started:
+                    # Semi-transparent overlay and title
+                    screen.blit(self._overlay_start, (0, 0))
+                    # Title, subtitle and control lines are pre-rendered and pre-laid-out
+                    screen.blits(self._start_screen_blits, 0)
+                    flip()
+                    clock_tick(FPS)
+                    continue
+                # Game over state: only show result panel and UI, wait for R/ESC
+                if self.game_over:
+                    # Background can still draw basic elements, for simplicity draw UI and end panel
+                    self.draw_ui()
+                    # Semi-transparent overlay
+                    screen.blit(self._overlay_game_over, (0, 0))
+                    # Text
+                    title = "Victory!" if self.game_result == 'win' else ("Defeat" if self.game_result == 'lose' else "Time's Up")
+                    t_surf = self._ctext(title, WHITE, self.large_font)
+                    msg_surf = self._ctext(self.end_message, WHITE)
+                    hint_surf = self._game_over_hint_surf
+                    cx = WIDTH//2
+                    screen.blit(t_surf, (cx - t_surf.get_width()//2, HEIGHT//2 - 70))
+                    screen.blit(msg_surf, (cx - msg_surf.get_width()//2, HEIGHT//2 - 20))
+                    screen.blit(hint_surf, (cx - hint_surf.get_width()//2, HEIGHT//2 + 30))
+                    flip()
+                    clock_tick(FPS)
+                    continue
+                # Paused state: show current screen + pause prompt once, don't update state/timer
+                if self.paused:
+                    # Draw current scene (baked obstacle layer; only the cat/item region is recomposed)
+                    self._draw_scene()
+                    self.draw_speech_bubble()
+                    self.draw_ui()
+                    # Overlay pause prompt
+                    screen.blit(self._overlay_paused, (0, 0))
+                    p_surf = self._paused_surf
+                    hint_surf = self._paused_hint_surf
+                    cx = WIDTH//2
+                    screen.blit(p_surf, (cx - p_surf.get_width()//2, HEIGHT//2 - 20))
+                    screen.blit(hint_surf, (cx - hint_surf.get_width()//2, HEIGHT//2 + 24))
+                    flip()
+                    clock_tick(FPS)
+                    continue
             
-            # Update game state
-            mouse_pos = pygame.mouse.get_pos()
+                # Update game state
+                mouse_pos = self._mouse_pos
             
-            # If cat is leaving screen, skip normal game logic
-            # Game continues running in waiting for player state (just don't show cat)
-            if not self.cat_leaving and not self.waiting_for_player:
-                # Normal game logic
-                # Every 10s let cat idle in open area for 3-4s (if not currently hiding)
-                if self.idle_frames <= 0:
-                    if self.idle_cooldown > 0:
-                        self.idle_cooldown -= 1
-                    elif self.hide_frames <= 0 and not self.hide_waiting and mouse_pos[1] > 60:
-                        # Enter idle: first ensure current position unobstructed, then time 3-4 seconds
-                        self.ensure_open_spot()
-                        self.idle_frames = random.randint(int(3 * FPS), int(4 * FPS))
-                        # Reset interval
-                        self.idle_cooldown = int(10 * FPS)
-
-                # Trigger hide-and-seek behavior: prioritize when mouse is near; otherwise low random chance with cooldown; don't trigger while stationary
-                if self.hide_frames <= 0 and self.idle_frames <= 0 and self.hide_cooldown <= 0 and mouse_pos[1] > 60:
-                    # Mouse-cat distance
-                    mdx = mouse_pos[0] - self.cat.x
-                    mdy = mouse_pos[1] - self.cat.y
-                    mdist = math.hypot(mdx, mdy)
-                    if mdist <= HIDE_NEAR_DISTANCE or random.random() < HIDE_TRIGGER_RANDOM_CHANCE:
-                        self.hide_target = self.compute_hide_spot(mouse_pos)
-                        self.hide_frames = random.randint(HIDE_DURATION_MIN_FRAMES, HIDE_DURATION_MAX_FRAMES)
-
-                if self.idle_frames > 0:
-                    # During idle: don't move
-                    self.idle_frames -= 1
-                    # Ensure don't accidentally enter toolbar
-                    self.cat.y = max(60 + self.cat.size, self.cat.y)
-                elif self.hide_frames > 0 and self.hide_target is not None:
-                    # Move toward hiding spot; on arrival, wait until timer ends to ensure 1–2 seconds of fully hidden state
-                    hx, hy = self.hide_target
-                    dx = hx - self.cat.x
-                    dy = hy - self.cat.y
-                    dist = math.hypot(dx, dy) or 1.0
-                    step = self.cat.speed
-                    if dist > step:
-                        # Calculate new position
-                        new_x = self.cat.x + (dx / dist) * step
-                        new_y = self.cat.y + (dy / dist) * step
+                # If cat is leaving screen, skip normal game logic
+                # Game continues running in waiting for player state (just don't show cat)
+                if not self.cat_leaving and not self.waiting_for_player:
+                    # Normal game logic
+                    # Hoisted lookups: size/speed only change in cat.grow() at the end of this block
+                    cat = self.cat
+                    csize, cspeed = cat.size, cat.speed
+                    # Every 10s let cat idle in open area for 3-4s (if not currently hiding)
+                    if self.idle_frames <= 0:
+                        if self.idle_cooldown > 0:
+                            self.idle_cooldown -= 1
+                        elif self.hide_frames <= 0 and not self.hide_waiting and mouse_pos[1] > 60:
+                            # Enter idle: first ensure current position unobstructed, then time 3-4 seconds
+                            self.ensure_open_spot()
+                            self.idle_frames = randint(IDLE_DURATION_MIN_FRAMES, IDLE_DURATION_MAX_FRAMES)
+                            # Reset interval
+                            self.idle_cooldown = IDLE_INTERVAL_FRAMES
+
+                    # Trigger hide-and-seek behavior: prioritize when mouse is near; otherwise low random chance with cooldown; don't trigger while stationary
+                    if self.hide_frames <= 0 and self.idle_frames <= 0 and self.hide_cooldown <= 0 and mouse_pos[1] > 60:
+                        # Mouse-cat distance (squared, compared against the squared threshold)
+                        mdx = mouse_pos[0] - cat.x
+                        mdy = mouse_pos[1] - cat.y
+                        if mdx * mdx + mdy * mdy <= HIDE_NEAR_DISTANCE_SQ or rand() < HIDE_TRIGGER_RANDOM_CHANCE:
+                            self.hide_target = self.compute_hide_spot(mouse_pos)
+                            self.hide_frames = randint(HIDE_DURATION_MIN_FRAMES, HIDE_DURATION_MAX_FRAMES)
+
+                    if self.idle_frames > 0:
+                        # During idle: don't move
+                        self.idle_frames -= 1
+                        # Ensure don't accidentally enter toolbar
+                        cat.y = max(60 + csize, cat.y)
+                    elif self.hide_frames > 0 and self.hide_target is not None:
+                        # Move toward hiding spot; on arrival, wait until timer ends to ensure 1–2 seconds of fully hidden state
+                        hx, hy = self.hide_target
+                        cat_x, cat_y = cat.x, cat.y
+                        dx = hx - cat_x
+                        dy = hy - cat_y
+                        step = cspeed
+                        # Arrival test on squared distance: no sqrt while waiting at the target
+                        d2 = dx * dx + dy * dy
+                        if d2 > step * step:
+                            # Calculate new position (one sqrt + one divide, then multiply)
+                            inv = step / sqrt(d2)
+                            new_x = cat_x + dx * inv
+                            new_y = cat_y + dy * inv
                         
-                        # Constrain within screen bounds (can't exceed)
-                        min_x = self.cat.size
-                        max_x = WIDTH - self.cat.size
-                        min_y = 60 + self.cat.size
-                        max_y = HEIGHT - self.cat.size
+                            # Constrain within screen bounds (can't exceed)
+                            min_x = csize
+                            max_x = WIDTH - csize
+                            min_y = 60 + csize
+                            max_y = HEIGHT - csize
                         
-                        self.cat.x = max(min_x, min(max_x, new_x))
-                        self.cat.y = max(min_y, min(max_y, new_y))
+                            cat.x = max(min_x, min(max_x, new_x))
+                            cat.y = max(min_y, min(max_y, new_y))
                         
-                        # Update facing based on target direction, so mirroring is correct during hiding
-                        if abs(dx) > 1e-3:
-                            self.cat.facing_right = (dx >= 0)
+                            # Update facing based on target direction, so mirroring is correct during hiding
+                            if abs(dx) > 1e-3:
+                                cat.facing_right = (dx >= 0)
+                        else:
+                            # Reached target, fix at target point and wait remaining time
+                            cat.x, cat.y = hx, hy
+                            self.hide_waiting = True
+                            self.hide_session_had_wait = True
+                        self.hide_frames -= 1
+                        if self.hide_frames <= 0:
+                            # End one hide session, if successfully reached interior, count toward completion
+                            if self.hide_session_had_wait:
+                                self.hide_completed += 1
+                            self.hide_session_had_wait = False
+                            self.hide_target = None
+                            self.hide_waiting = False
+                            self.hide_cooldown = HIDE_COOLDOWN_FRAMES
+                            # Hide session boundary: cheap young-generation collection
+                            gc.collect(1)
                     else:
-                        # Reached target, fix at target point and wait remaining time
-                        self.cat.x, self.cat.y = hx, hy
-                        self.hide_waiting = True
-                        self.hide_session_had_wait = True
-                    self.hide_frames -= 1
-                    if self.hide_frames <= 0:
-                        # End one hide session, if successfully reached interior, count toward completion
-                        if self.hide_session_had_wait:
-                            self.hide_completed += 1
-                        self.hide_session_had_wait = False
-                        self.hide_target = None
-                        self.hide_waiting = False
-                        self.hide_cooldown = HIDE_COOLDOWN_FRAMES
+                        # Regular movement: slow down in open areas
+                        cat.move(CAT_OPEN_SPEED_FACTOR)
+                    # Cat-obstacle collision handling (circle-rect): use normal reflection, reduce jitter
+                    # While hiding, allow the cat to enter obstacles (be occluded), so skip collision push-out
+                    if not (self.hide_frames > 0 or self.hide_waiting):
+                        # Broad phase via the left-edge index: only rects meeting the circle's bounding box can overlap
+                        # (candidates come back in index order, so the first hit is the same as a full scan)
+                        # Position/velocity are read into locals once; cat attributes are written only on a hit
+                        ccx, ccy, r = cat.x, cat.y, csize
+                        obs_l, obs_t, obs_r, obs_b = self._obs_l, self._obs_t, self._obs_r, self._obs_b
+                        r2 = r * r
+                        for i in self._obstacles_in_box(ccx - r, ccy - r, ccx + r, ccy + r):
+                            # Narrow phase on the cached edges, circle_box_overlap inlined (no call frame per candidate)
+                            left, top, right, bottom = obs_l[i], obs_t[i], obs_r[i], obs_b[i]
+                            ndx = ccx - (left if ccx < left else (right if ccx > right else ccx))
+                            ndy = ccy - (top if ccy < top else (bottom if ccy > bottom else ccy))
+                            if ndx * ndx + ndy * ndy <= r2:
+                                # The resolver's result tuple is unpacked straight into the cat (no temporaries)
+                                cat.x, cat.y, cat.dx, cat.dy = resolve_circle_box_collision(
+                                    ccx, ccy, r, left, top, right, bottom, cat.dx, cat.dy)
+                                break
+                    cat.grow()
+            
+                    # Check collision for every item that landed this frame (the latest message is shown)
+                    message = ""
+                    for hit_item in self.player.update_items():
+                        if hit_item.blocked:
+                            message = "Blocked by obstacle!"
+                        else:
+                            hit, hit_message = self.check_collision(hit_item)
+                            if hit_message:
+                                message = hit_message
+                elif self.waiting_for_player:
+                    # Waiting for player keypress state: update thrown items but don't collide with cat
+                    self.player.update_items()
+                    message = ""
                 else:
-                    # Regular movement: slow down in open areas
-                    self.cat.move(CAT_OPEN_SPEED_FACTOR)
-                # Cat-obstacle collision handling (circle-rect): use normal reflection, reduce jitter
-                # While hiding, allow the cat to enter obstacles (be occluded), so skip collision push-out
-                if not (self.hide_frames > 0 or self.hide_waiting):
-                    for rect in self.obstacles:
-                        if circle_rect_overlap(self.cat.x, self.cat.y, self.cat.size, rect):
-                            nx, ny, vx, vy = resolve_circle_rect_collision(self.cat.x, self.cat.y, self.cat.size, rect, self.cat.dx, self.cat.dy)
-                            self.cat.x, self.cat.y = nx, ny
-                            self.cat.dx, self.cat.dy = vx, vy
-                            break
-                self.cat.grow()
-                hit_item = self.player.update_items()
+                    # Cat is leaving, don't process game logic
+                    message = ""
             
-                # Check collision
-                message = ""
-                if hit_item:
-                    if isinstance(hit_item, dict) and hit_item.get('_blocked'):
-                        message = "Blocked by obstacle!"
+                # Hold the latest message for MESSAGE_HOLD_FRAMES steps (its cached surface is re-blitted meanwhile),
+                # so it is seen even if its own step was a skipped render
+                if message:
+                    self._message = message
+                    self._message_frames = MESSAGE_HOLD_FRAMES
+                elif self._message_frames > 0:
+                    self._message_frames -= 1
+                    message = self._message if self._message_frames > 0 else ""
+
+                # Skip drawing this step when it is running more than a frame behind schedule
+                # (logic above already ran; no flip and no clock wait, so the next step starts right away)
+                now = perf_counter()
+                if now - frame_due > RENDER_RESYNC_LAG:
+                    frame_due = frame_start
+                if now - frame_due > frame_s and render_skips < MAX_RENDER_SKIPS:
+                    render_skips += 1
+                    frame_due += frame_s
+                else:
+                    render_skips = 0
+                    # Push only the changed regions when the frame was composed on the presented layer
+                    update_rects = self._render_frame(message)
+                    if update_rects is None:
+                        flip()
                     else:
-                        hit, message = self.check_collision(hit_item)
-            elif self.waiting_for_player:
-                # Waiting for player keypress state: update thrown items but don't collide with cat
-                hit_item = self.player.update_items()
-                message = ""
-            else:
-                # Cat is leaving, don't process game logic
-                message = ""
-            
-            # Draw game elements (don't draw cat when waiting for player)
-            if not self.waiting_for_player:
-                self.cat.draw()
-            self.player.draw_items()
-            # Obstacles drawn last, used to occlude cat and items
-            self.draw_obstacles()
-            # Draw the speech bubble above obstacles to keep it visible
-            self.draw_speech_bubble()
-            self.draw_ui()
-            # Direction arrow hint (show when waiting for player)
-            self.draw_direction_arrows()
-            # Targeting effect (don't show during waiting for player state)
-            if not self.waiting_for_player:
-                self.draw_targeting()
-            
-            # Show messages
-            if message:
-                msg_surface = self.font.render(message, True, BLUE)
-                screen.blit(msg_surface, (WIDTH // 2 - msg_surface.get_width() // 2, 70))
-            
-            # Refresh screen
-            pygame.display.flip()
-            clock.tick(FPS)
-            # Print a heartbeat roughly once per second to confirm the loop is running
-            ticks += 1
-            if ticks % FPS == 0:
-                log(f"Heartbeat: running, score={self.player.score}, affinity={self.cat.affinity}, stage={self.cat.growth_stage}, wrong_streak={self.player.consecutive_wrong}")
-            # Cooldowns tick down
-            if self.hide_cooldown > 0:
-                self.hide_cooldown -= 1
-            if self.force_hide_cooldown > 0:
-                self.force_hide_cooldown -= 1
-            # Periodically refresh speech text (random every 3–5 seconds)
-            if hasattr(self, "_need_frames_left"):
+                        update_display(update_rects)
+                    clock_tick(FPS)
+                    frame_due = min(frame_due + frame_s, perf_counter())
+                # Print a heartbeat roughly once per second to confirm the loop is running
+                heartbeat_countdown -= 1
+                if heartbeat_countdown <= 0:
+                    heartbeat_countdown = FPS
+                    if LOG_HEARTBEAT:
+                        log("Heartbeat: running, score=%s, affinity=%s, stage=%s, wrong_streak=%s",
+                            self.player.score, self.cat.affinity, self.cat.growth_stage, self.player.consecutive_wrong)
+                # Countdowns: each is read once, decremented (clamped at 0) and written back only when it changed;
+                # the win/lose and forced-hide checks below reuse the locals instead of re-reading attributes
+                hide_cooldown = self.hide_cooldown
+                if hide_cooldown > 0:
+                    hide_cooldown -= 1
+                    self.hide_cooldown = hide_cooldown
+                force_hide_cooldown = self.force_hide_cooldown
+                if force_hide_cooldown > 0:
+                    force_hide_cooldown -= 1
+                    self.force_hide_cooldown = force_hide_cooldown
+                # Periodically refresh speech text (random every 3–5 seconds)
                 self._need_frames_left -= 1
                 if self._need_frames_left <= 0:
                     need = self.cat.get_current_need()
-                    self.need_text = "I want food!" if need == "food" else "I want a toy!"
-                    self._need_frames_left = random.randint(BUBBLE_REFRESH_MIN_FRAMES, BUBBLE_REFRESH_MAX_FRAMES)
-            # Timer and win/lose conditions
-            if self.time_left > 0:
-                self.time_left -= 1
-            if self.loss_grace > 0:
-                self.loss_grace -= 1
-            if self.loss_grace <= 0 and self.cat.affinity <= 0 and not self.game_over:
-                self.game_over = True
-                self.game_result = 'lose'
-                self.end_message = "Affinity dropped to 0. The cat ran away..."
-            if self.time_left <= 0 and not self.game_over:
-                if self.cat.affinity >= 80 or self.cat.growth_stage >= 3:
+                    self.need_text = NEED_TEXTS[need]
+                    self._need_frames_left = randint(BUBBLE_REFRESH_MIN_FRAMES, BUBBLE_REFRESH_MAX_FRAMES)
+                # Timer and win/lose conditions
+                # time_left is always positive here (the frame it reaches 0 ends the game), so it needs no guard
+                time_left = self.time_left - 1
+                self.time_left = time_left
+                loss_grace = self.loss_grace
+                if loss_grace > 0:
+                    loss_grace -= 1
+                    self.loss_grace = loss_grace
+                if loss_grace <= 0 and self.cat.affinity <= 0 and not self.game_over:
                     self.game_over = True
-                    self.game_result = 'win'
-                    self.end_message = f"Congrats! Final Score {self.player.score}; Affinity {int(self.cat.affinity)}%"
-                else:
-                    self.game_over = True
-                    self.game_result = 'summary'
-                    self.end_message = f"Time's up. Score {self.player.score}; Affinity {int(self.cat.affinity)}%, Stage {self.cat.growth_stage}"
-
-            # Guarantee: complete at least three fully hidden events
-            # If not hiding/stationary/on cooldown and the count is insufficient, force one hide and ensure enough time to reach the target plus ≥1s wait
-            if (not self.game_over and self.started and not self.paused 
-                and self.hide_frames <= 0 and not self.hide_waiting 
-                and self.idle_frames <= 0 and self.hide_cooldown <= 0 
-                and self.force_hide_cooldown <= 0 and self.hide_completed < self.min_hide_goal):
-                mx, my = pygame.mouse.get_pos()
-                if my > 60:
-                    target = self.compute_hide_spot((mx, my))
-                    self.hide_target = target
-                    # Compute distance to target; allocate travel frames plus at least 1.2 seconds of lingering
-                    dx = target[0] - self.cat.x
-                    dy = target[1] - self.cat.y
-                    dist = math.hypot(dx, dy)
-                    travel_frames = int(math.ceil((dist / max(1e-6, self.cat.speed))))
-                    wait_frames = int(1.2 * FPS)
-                    self.hide_frames = max(HIDE_DURATION_MIN_FRAMES, travel_frames + wait_frames)
-                    self.force_hide_cooldown = int(5 * FPS)
-
+                    self.game_result = 'lose'
+                    self.end_message = "Affinity dropped to 0. The cat ran away..."
+                if time_left <= 0 and not self.game_over:
+                    if self.cat.affinity >= 80 or self.cat.growth_stage >= 3:
+                        self.game_over = True
+                        self.game_result = 'win'
+                        self.end_message = f"Congrats! Final Score {self.player.score}; Affinity {int(self.cat.affinity)}%"
+                    else:
+                        self.game_over = True
+                        self.game_result = 'summary'
+                        self.end_message = f"Time's up. Score {self.player.score}; Affinity {int(self.cat.affinity)}%, Stage {self.cat.growth_stage}"
+
+                # Guarantee: complete at least three fully hidden events
+                # If not hiding/stationary/on cooldown and the count is insufficient, force one hide and ensure enough time to reach the target plus ≥1s wait
+                # Only reached while started and unpaused (those states `continue` above); conjuncts are ordered
+                # cheapest/most-often-false first: local cooldowns, then the goal check, then per-frame hide state
+                if (force_hide_cooldown <= 0 and hide_cooldown <= 0
+                    and self.hide_completed < self.min_hide_goal
+                    and self.hide_frames <= 0 and not self.hide_waiting
+                    and self.idle_frames <= 0 and not self.game_over):
+                    mx, my = self._mouse_pos
+                    if my > 60:
+                        target = self.compute_hide_spot((mx, my))
+                        self.hide_target = target
+                        # Allocate travel frames to the target plus at least 1.2 seconds of lingering
+                        # (math.ceil already returns an int; speed is a positive per-stage constant)
+                        cat = self.cat
+                        travel_frames = ceil(hypot(target[0] - cat.x, target[1] - cat.y) / max(1e-6, cat.speed))
+                        self.hide_frames = max(HIDE_DURATION_MIN_FRAMES, travel_frames + FORCED_HIDE_WAIT_FRAMES)
+                        self.force_hide_cooldown = FORCED_HIDE_COOLDOWN_FRAMES
+        finally:
+            # Restore normal collection even if the loop raised
+            gc.unfreeze()
+            gc.enable()
         log("Game loop exiting. Cleaning up...")
         pygame.quit()
         log("Pygame quit done. Exiting process.")